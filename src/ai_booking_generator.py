@@ -1,19 +1,380 @@
 import streamlit as st
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from vertex_ai_utils import VertexAITripPlanner
+import re
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from vertexai.preview.generative_models import GenerationConfig
+from google.api_core.exceptions import InvalidArgument
+from vertex_ai_utils import trip_planner
 import random
+try:
+    # orjson parses model output several times faster; its decode error subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+try:
+    # Tolerant one-pass parser for truncated/malformed model output; the regex repair chain is the fallback
+    from json_repair import repair_json
+except ImportError:
+    repair_json = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# JSON repair patterns, compiled once instead of on every parse
+_RE_UNTERM_NL = re.compile(r'"([^"]*?)\n')
+_RE_UNTERM_EOL = re.compile(r'"([^"]*?)$')
+_RE_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+_RE_ARRAY_START = re.compile(r'\[.*', re.DOTALL)
+_RE_INNER_QUOTES = re.compile(r'"([^"]*)"([^"]*)"([^"]*)"')
+_RE_BARE_KEY = re.compile(r'(\w+):')
+_RE_KEY_VALUE = re.compile(r'"([^"]+)":\s*"([^"]*)"')
+_WHITESPACE_TO_SPACE = str.maketrans('\n\r\t', '   ')
+_RE_CODE_FENCE = re.compile(r'^\s*```(?:json)?\s*(.*?)\s*```\s*$', re.DOTALL)
+
+# Static prompt instructions, identical for every search; only the SEARCH CRITERIA block that follows varies
+_FLIGHT_PROMPT_INSTRUCTIONS = """
+You are a travel booking expert. Generate exactly 3 realistic flight options for the search criteria below.
+Respond ONLY with a JSON array of 3 objects matching this schema (prices in INR):
+{"flight_id":"str","airline":"str","flight_number":"str","origin":"str","destination":"str","departure_time":"HH:MM","arrival_time":"HH:MM","duration":"str","price":int,"currency":"INR","class_type":"str","available_seats":int 5-25,"stops":"Non-stop|1 stop|2 stops","aircraft":"str"}
+"""
+
+_HOTEL_PROMPT_INSTRUCTIONS = """
+You are a hotel booking expert. Generate exactly 3 realistic hotel options in the search city below.
+Respond ONLY with a JSON array of 3 objects matching this schema (prices in INR):
+{"hotel_id":"str","name":"str","city":"str","address":"str","star_rating":int 3-5,"price_per_night":int,"currency":"INR","check_in":"YYYY-MM-DD","check_out":"YYYY-MM-DD","total_price":int,"amenities":["str"],"room_type":"str","available_rooms":int 1-8,"cancellation_policy":"str","rating":float 3.5-4.8,"reviews_count":int 50-500}
+"""
+
+# Server-side response schemas (Vertex AI OpenAPI subset) mirroring the prompt schemas above
+_STRING = {"type": "string"}
+_INTEGER = {"type": "integer"}
+_FLIGHT_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "flight_id": _STRING, "airline": _STRING, "flight_number": _STRING,
+        "origin": _STRING, "destination": _STRING,
+        "departure_time": _STRING, "arrival_time": _STRING, "duration": _STRING,
+        "price": _INTEGER, "currency": _STRING, "class_type": _STRING,
+        "available_seats": _INTEGER,
+        "stops": {"type": "string", "enum": ["Non-stop", "1 stop", "2 stops"]},
+        "aircraft": _STRING
+    },
+    "required": ["flight_id", "airline", "flight_number", "departure_time", "arrival_time",
+                 "duration", "price", "stops"]
+}
+_HOTEL_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "hotel_id": _STRING, "name": _STRING, "city": _STRING, "address": _STRING,
+        "star_rating": _INTEGER, "price_per_night": _INTEGER, "currency": _STRING,
+        "check_in": _STRING, "check_out": _STRING, "total_price": _INTEGER,
+        "amenities": {"type": "array", "items": _STRING},
+        "room_type": _STRING, "available_rooms": _INTEGER, "cancellation_policy": _STRING,
+        "rating": {"type": "number"}, "reviews_count": _INTEGER
+    },
+    "required": ["hotel_id", "name", "address", "star_rating", "price_per_night",
+                 "amenities", "room_type", "rating"]
+}
+
+_RESPONSE_SCHEMAS = {"flight": _FLIGHT_RESPONSE_SCHEMA, "hotel": _HOTEL_RESPONSE_SCHEMA}
+
+# Gemini 1.0 models ("gemini-pro", "gemini-1.0-*") reject response_mime_type/response_schema
+_LEGACY_MODEL_PREFIXES = ("gemini-pro", "gemini-1.0")
+# InvalidArgument messages about controlled generation name the field (snake_case or camelCase)
+_RE_STRUCTURED_OUTPUT_ERROR = re.compile(r'response_?(?:schema|mime_?type)', re.IGNORECASE)
+
+def _supports_controlled_generation(model_name: Optional[str]) -> bool:
+    """Whether the configured model accepts a JSON mime type and response schema"""
+    return bool(model_name) and not model_name.rsplit("/", 1)[-1].startswith(_LEGACY_MODEL_PREFIXES)
+
+@lru_cache(maxsize=None)
+def _json_generation_config(kind: str, structured: bool) -> GenerationConfig:
+    """Generation config for a flight/hotel search, built on first use instead of at import
+
+    Same sampling settings as the shared model. With structured=True, constrained decoding
+    guarantees well-formed JSON unless the output is cut off at max_output_tokens.
+    """
+    if structured:
+        try:
+            return GenerationConfig(
+                temperature=0.7,
+                max_output_tokens=1024,
+                response_mime_type="application/json",
+                response_schema={"type": "array", "items": _RESPONSE_SCHEMAS[kind]}
+            )
+        except (TypeError, ValueError) as e:
+            # Older SDKs don't know response_schema; fall back to prompt-only JSON
+            logger.warning("Vertex AI SDK rejected the response schema, using prompt-only JSON: %s", e)
+    return GenerationConfig(temperature=0.7, max_output_tokens=1024)
+
+# Fields kept from AI results, with fallbacks for missing ones; key order is the order of the validated dicts.
+# None marks fields filled per record (random ids) or per search (origin, city, dates, totals)
+_FLIGHT_DEFAULTS = {
+    "flight_id": None,
+    "airline": "Unknown Airline",
+    "flight_number": None,
+    "origin": None,
+    "destination": None,
+    "departure_time": "08:00",
+    "arrival_time": "10:00",
+    "duration": "2h 00m",
+    "price": 5000,
+    "currency": "INR",
+    "class_type": "Economy",
+    "available_seats": 15,
+    "stops": "Non-stop",
+    "aircraft": "Boeing 737"
+}
+_DEFAULT_HOTEL_AMENITIES = ("WiFi", "Pool", "Gym", "Restaurant")
+_HOTEL_DEFAULTS = {
+    "hotel_id": None,
+    "name": None,
+    "city": None,
+    "address": None,
+    "star_rating": 4,
+    "price_per_night": 3000,
+    "currency": "INR",
+    "check_in": None,
+    "check_out": None,
+    "total_price": None,
+    "amenities": None,
+    "room_type": "Deluxe Room",
+    "available_rooms": 5,
+    "cancellation_policy": "Free cancellation until 24 hours before check-in",
+    "rating": 4.2,
+    "reviews_count": 150
+}
+
+# Option templates for rebuilding 3 choices from truncated AI output; search-specific fields are filled per call
+_MINIMAL_HOTEL_NAMES = ('Taj Palace', 'Oberoi Hotel', 'ITC Maratha')
+_MINIMAL_ROOM_TYPES = ('Deluxe Room', 'Executive Suite', 'Presidential Suite')
+_MINIMAL_AMENITY_SETS = (
+    ('WiFi', 'Pool', 'Gym', 'Restaurant'),
+    ('WiFi', 'Spa', 'Business Center', 'Restaurant', 'Pool'),
+    ('WiFi', 'Pool', 'Gym', 'Restaurant', 'Spa', 'Concierge', 'Room Service')
+)
+_MINIMAL_AIRLINES = ('Air India', 'IndiGo', 'SpiceJet')
+_MINIMAL_FLIGHT_CODES = ('AI', '6E', 'SG')
+_MINIMAL_AIRCRAFT_TYPES = ('Boeing 737', 'Airbus A320', 'Boeing 777')
+
+_MINIMAL_HOTEL_TEMPLATES = tuple(
+    {
+        'hotel_id': f"hotel_{1000 + i}",
+        'name': _MINIMAL_HOTEL_NAMES[i],
+        'city': None,
+        'address': None,
+        'star_rating': 3 + i,  # 3, 4, 5 stars
+        'price_per_night': 2000 + (i * 2000) + (i * 500),  # 2000, 4500, 7000
+        'currency': 'INR',
+        'check_in': None,
+        'check_out': None,
+        'total_price': (2000 + (i * 2000) + (i * 500)) * 5,  # Assuming 5 nights
+        'amenities': _MINIMAL_AMENITY_SETS[i],
+        'room_type': _MINIMAL_ROOM_TYPES[i],
+        'available_rooms': 8 - i*2,
+        'cancellation_policy': 'Free cancellation until 24 hours before check-in',
+        'rating': 4.0 + (i * 0.3),
+        'reviews_count': 100 + (i * 100)
+    }
+    for i in range(3)
+)
+
+_MINIMAL_FLIGHT_TEMPLATES = tuple(
+    {
+        'flight_id': f"flight_{1000 + i}",
+        'airline': _MINIMAL_AIRLINES[i],
+        'flight_number': f"{_MINIMAL_FLIGHT_CODES[i]}{1000 + i}",
+        'origin': None,
+        'destination': None,
+        'departure_time': f"{6 + i * 3:02d}:{30 + i*15:02d}",  # 6:30, 9:45, 12:00
+        'arrival_time': f"{8 + i * 3:02d}:{45 + i*10:02d}",  # 8:45, 11:55, 15:00
+        'duration': f"{2 + i}h {15 + i*15}m",
+        'price': 4000 + (i * 2500) + (i * 500),  # 4000, 7000, 10000
+        'currency': 'INR',
+        'class_type': 'Economy',
+        'available_seats': 25 - i*5,
+        'stops': 'Non-stop' if i == 0 else f"{i} stop",
+        'aircraft': _MINIMAL_AIRCRAFT_TYPES[i]
+    }
+    for i in range(3)
+)
+
+# Parsed AI results kept per distinct prompt; reruns re-issue identical searches
+_SUGGESTION_CACHE_SIZE = 64
+# Seconds a cached AI result stays valid before the search goes back to the model
+_SUGGESTION_CACHE_TTL = int(os.getenv("SUGGESTION_CACHE_TTL", "600"))
+
+# Lookup tables for the enhanced mock data; room types, amenities and aircraft reuse the _MINIMAL_* tuples
+_DEFAULT_MOCK_AIRLINES = ('Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir')
+_DESTINATION_AIRLINES = {
+    code: _DEFAULT_MOCK_AIRLINES
+    for code in ('BOM', 'DEL', 'BLR', 'MAA', 'CCU', 'HYD', 'PNQ', 'AMD', 'JAI', 'GOI', 'COK')
+}
+_MOCK_FLIGHT_CODES = ('AI', '6E', 'SG', 'UK', 'G8')
+_DEFAULT_CITY_HOTELS = ('Taj Palace', 'Oberoi Hotel', 'ITC Maratha', 'Le Meridien', 'Holiday Inn', 'Radisson Blu')
+_CITY_HOTELS = {
+    'Mumbai': ('Taj Palace', 'Oberoi Hotel', 'ITC Maratha', 'Le Meridien', 'Holiday Inn', 'Radisson Blu'),
+    'Delhi': ('The Leela Palace', 'Taj Palace', 'The Oberoi', 'ITC Maurya', 'Holiday Inn', 'Radisson Blu'),
+    'Bangalore': ('Taj West End', 'The Leela Palace', 'ITC Gardenia', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'),
+    'Chennai': ('Taj Coromandel', 'The Leela Palace', 'ITC Grand Chola', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'),
+    'Kolkata': ('Taj Bengal', 'The Oberoi', 'ITC Sonar', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'),
+    'Hyderabad': ('Taj Falaknuma Palace', 'The Leela Palace', 'ITC Kakatiya', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'),
+    'Pune': ('Taj Blue Diamond', 'The Leela Palace', 'ITC Maratha', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'),
+    'Ahmedabad': ('Taj Skyline', 'The Leela Palace', 'ITC Narmada', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'),
+    'Jaipur': ('Taj Rambagh Palace', 'The Leela Palace', 'ITC Rajputana', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'),
+    'Goa': ('Taj Exotica', 'The Leela Palace', 'ITC Maratha', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'),
+    'Kerala': ('Taj Malabar', 'The Leela Palace', 'ITC Grand Chola', 'JW Marriott', 'Holiday Inn', 'Radisson Blu')
+}
+
+# Every table lists at least 5 names, so the 3 options per destination/city are a plain slice
+_UNIQUE_AIRLINES_BY_DEST = {dest: airlines[:3] for dest, airlines in _DESTINATION_AIRLINES.items()}
+_DEFAULT_UNIQUE_AIRLINES = _DEFAULT_MOCK_AIRLINES[:3]
+_UNIQUE_FLIGHT_CODES = _MOCK_FLIGHT_CODES[:3]
+_UNIQUE_HOTELS_BY_CITY = {city: names[:3] for city, names in _CITY_HOTELS.items()}
+_DEFAULT_UNIQUE_HOTELS = _DEFAULT_CITY_HOTELS[:3]
+
+# Per-option fields of the enhanced mock data that never vary; None marks fields filled per search
+_MOCK_FLIGHT_TEMPLATES = tuple(
+    {
+        "flight_id": f"{code}{1000 + i}",
+        "airline": None,
+        "flight_number": f"{code}{1000 + i}",
+        "origin": None,
+        "destination": None,
+        "departure_time": f"{6 + i * 3:02d}:{30 + i*15:02d}",
+        "arrival_time": f"{int(6 + i * 3 + 2 + i * 0.5):02d}:{45 + i*10:02d}",
+        "duration": f"{2 + i}h {15 + i*15}m",
+        "price": None,
+        "currency": "INR",
+        "class_type": None,
+        "available_seats": 25 - i*5,
+        "stops": "Non-stop" if i == 0 else f"{i} stop",
+        "aircraft": _MINIMAL_AIRCRAFT_TYPES[i]
+    }
+    for i, code in enumerate(_UNIQUE_FLIGHT_CODES)
+)
+_MOCK_HOTEL_TEMPLATES = tuple(
+    {
+        "hotel_id": f"hotel_{1000 + i}",
+        "name": None,
+        "city": None,
+        "address": None,
+        "star_rating": 3 + i,  # 3, 4, 5 stars
+        "price_per_night": None,
+        "currency": "INR",
+        "check_in": None,
+        "check_out": None,
+        "total_price": None,
+        "amenities": _MINIMAL_AMENITY_SETS[i],
+        "room_type": _MINIMAL_ROOM_TYPES[i],
+        "available_rooms": 8 - i*2,
+        "cancellation_policy": "Free cancellation until 24 hours before check-in",
+        "rating": None,
+        "reviews_count": None
+    }
+    for i in range(3)
+)
+
+def _ymd_to_ordinal(ymd: str) -> int:
+    """Day ordinal of a YYYY-MM-DD date (date.fromisoformat is much cheaper than strptime)"""
+    return date.fromisoformat(ymd).toordinal()
+
+# Mock options are a pure function of the route/stay (each option has its own seeded RNG), so compute each once
+@lru_cache(maxsize=256)
+def _enhanced_flight_mock_options(origin: str, destination: str, class_type: str) -> tuple:
+    """Build the 3 enhanced mock flight options for a route"""
+    flights = []
+    
+    # Airlines for the destination, resolved to 3 unique options at import
+    unique_airlines = _UNIQUE_AIRLINES_BY_DEST.get(destination, _DEFAULT_UNIQUE_AIRLINES)
+    
+    for i, template in enumerate(_MOCK_FLIGHT_TEMPLATES):
+        rng = random.Random(hash(f"{origin}{destination}{i}"))  # Deterministic per route; leaves global random alone
+        flights.append({
+            **template,
+            "airline": unique_airlines[i],
+            "origin": origin,
+            "destination": destination,
+            "price": 4000 + (i * 2500) + rng.randint(0, 1000),
+            "class_type": class_type
+        })
+    
+    return tuple(flights)
+
+
+@lru_cache(maxsize=256)
+def _enhanced_hotel_mock_options(city: str, check_in: str, check_out: str) -> tuple:
+    """Build the 3 enhanced mock hotel options for a stay"""
+    hotels = []
+    
+    # Hotel names for the city, resolved to 3 unique options at import
+    unique_hotels = _UNIQUE_HOTELS_BY_CITY.get(city, _DEFAULT_UNIQUE_HOTELS)
+    
+    # Calculate total price
+    nights = _ymd_to_ordinal(check_out) - _ymd_to_ordinal(check_in)
+    
+    # Add some randomness to make each hotel unique
+    for i, template in enumerate(_MOCK_HOTEL_TEMPLATES):
+        rng = random.Random(hash(f"{city}{check_in}{i}"))  # Deterministic per city/date; leaves global random alone
+        base_price = 2000 + (i * 2000)  # 2000, 4000, 6000
+        price_per_night = base_price + rng.randint(0, 1000)
+        hotels.append({
+            **template,
+            "name": unique_hotels[i],
+            "city": city,
+            "address": f"{100 + i*50} Main Street, {city}",
+            "price_per_night": price_per_night,
+            "check_in": check_in,
+            "check_out": check_out,
+            "total_price": price_per_night * nights,
+            "rating": 4.0 + (i * 0.3) + rng.uniform(0, 0.2),
+            "reviews_count": 100 + (i * 100) + rng.randint(0, 50)
+        })
+    
+    return tuple(hotels)
+
+
 class AIBookingDataGenerator:
     """Generates dynamic hotel and flight booking data using AI"""
     
     def __init__(self):
-        self.vertex_ai = VertexAITripPlanner()
+        # Share the module-level planner so reruns reuse its Vertex AI client
+        self.vertex_ai = trip_planner
+        # {prompt digest: (expires_at, items)}; Streamlit sessions run on separate threads, so guard it with a lock
+        self._suggestion_cache = OrderedDict()
+        self._suggestion_cache_lock = threading.Lock()
+        # Cleared the first time the model rejects a response schema, so later calls skip the failed attempt
+        self._structured_output = True
+    
+    def _suggestion_cache_key(self, prompt: str) -> bytes:
+        return hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).digest()
+    
+    def _get_cached_suggestions(self, key: bytes) -> Optional[List[Dict]]:
+        """Return copies of the parsed options for a prompt seen recently, or None"""
+        with self._suggestion_cache_lock:
+            cached = self._suggestion_cache.get(key)
+            if cached is None:
+                return None
+            if cached[0] <= time.monotonic():
+                del self._suggestion_cache[key]
+                return None
+            self._suggestion_cache.move_to_end(key)
+        return [dict(item) for item in cached[1]]
+    
+    def _store_suggestions(self, key: bytes, items: List[Dict]):
+        entry = (time.monotonic() + _SUGGESTION_CACHE_TTL, [dict(item) for item in items])
+        with self._suggestion_cache_lock:
+            self._suggestion_cache[key] = entry
+            self._suggestion_cache.move_to_end(key)
+            if len(self._suggestion_cache) > _SUGGESTION_CACHE_SIZE:
+                self._suggestion_cache.popitem(last=False)
     
     def generate_flight_data(self, origin: str, destination: str, departure_date: str, 
                            return_date: str = None, passengers: int = 1, 
@@ -38,16 +399,7 @@ class AIBookingDataGenerator:
                 origin, destination, departure_date, return_date, passengers, class_type
             )
             
-            return {
-                "search_id": f"search_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                "origin": origin,
-                "destination": destination,
-                "departure_date": departure_date,
-                "return_date": return_date,
-                "flights": flight_suggestions,
-                "total_results": len(flight_suggestions),
-                "search_timestamp": datetime.now().isoformat()
-            }
+            return self._flight_search_result(origin, destination, departure_date, return_date, flight_suggestions)
             
         except Exception as e:
             logger.error(f"Error generating flight data: {str(e)}")
@@ -74,76 +426,102 @@ class AIBookingDataGenerator:
                 city, check_in, check_out, rooms, guests
             )
             
-            return {
-                "search_id": f"hotel_search_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                "city": city,
-                "check_in": check_in,
-                "check_out": check_out,
-                "hotels": hotel_suggestions,
-                "total_results": len(hotel_suggestions),
-                "search_timestamp": datetime.now().isoformat()
-            }
+            return self._hotel_search_result(city, check_in, check_out, hotel_suggestions)
             
         except Exception as e:
             logger.error(f"Error generating hotel data: {str(e)}")
             return self._get_fallback_hotel_data(city, check_in, check_out)
     
+    def _generate_json_content(self, prompt: str, kind: str):
+        """Call the model for a JSON flight/hotel response, constrained by a schema where the model allows it"""
+        model = self.vertex_ai.model
+        if self._structured_output and _supports_controlled_generation(self.vertex_ai.model_name):
+            try:
+                return model.generate_content(prompt, generation_config=_json_generation_config(kind, True))
+            except InvalidArgument as e:
+                # Other bad requests (prompt, quota, arguments) fail without the schema too; don't disable it for them
+                if not _RE_STRUCTURED_OUTPUT_ERROR.search(str(e)):
+                    raise
+                logger.warning("Model %s rejected structured output, retrying without it: %s",
+                               self.vertex_ai.model_name, e)
+                self._structured_output = False
+        return model.generate_content(prompt, generation_config=_json_generation_config(kind, False))
+    
+    def _flight_search_result(self, origin: str, destination: str, departure_date: str, 
+                             return_date: str, flights: List[Dict]) -> Dict:
+        """Wrap flight options in the search result envelope"""
+        now = datetime.now()  # one clock read for both the id and the timestamp
+        return {
+            "search_id": f"search_{now:%Y%m%d_%H%M%S}",
+            "origin": origin,
+            "destination": destination,
+            "departure_date": departure_date,
+            "return_date": return_date,
+            "flights": flights,
+            "total_results": len(flights),
+            "search_timestamp": now.isoformat()
+        }
+    
+    def _hotel_search_result(self, city: str, check_in: str, check_out: str, hotels: List[Dict]) -> Dict:
+        """Wrap hotel options in the search result envelope"""
+        now = datetime.now()  # one clock read for both the id and the timestamp
+        return {
+            "search_id": f"hotel_search_{now:%Y%m%d_%H%M%S}",
+            "city": city,
+            "check_in": check_in,
+            "check_out": check_out,
+            "hotels": hotels,
+            "total_results": len(hotels),
+            "search_timestamp": now.isoformat()
+        }
+    
     def _generate_ai_flight_suggestions(self, origin: str, destination: str, 
                                        departure_date: str, return_date: str = None, 
                                        passengers: int = 1, class_type: str = "Economy") -> List[Dict]:
         """Generate AI-powered flight suggestions"""
         try:
+            # Nothing below is useful without a model, so skip prompt building entirely
+            if not (self.vertex_ai.is_configured and self.vertex_ai.model):
+                logger.warning("⚠️ Vertex AI not configured, using enhanced mock data")
+                return self._generate_enhanced_flight_mock_data(origin, destination, departure_date, return_date, passengers, class_type)
+            
             # Create prompt for flight generation
             prompt = self._create_flight_prompt(origin, destination, departure_date, return_date, passengers, class_type)
+            cache_key = self._suggestion_cache_key(prompt)
+            cached = self._get_cached_suggestions(cache_key)
+            if cached is not None:
+                logger.info("♻️ Reusing cached flight suggestions for an identical search")
+                return cached
             
-            # Log the prompt being sent to AI
-            logger.info("=" * 80)
-            logger.info("🤖 AI FLIGHT GENERATION REQUEST")
-            logger.info("=" * 80)
-            logger.info(f"Origin: {origin} → Destination: {destination}")
-            logger.info(f"Departure: {departure_date}, Return: {return_date}")
-            logger.info(f"Passengers: {passengers}, Class: {class_type}")
-            logger.info("-" * 80)
-            logger.info("PROMPT SENT TO AI:")
-            logger.info(prompt)
-            logger.info("-" * 80)
+            # Full prompt only at DEBUG; lazy %-formatting so nothing is built when filtered out
+            logger.info("🤖 AI flight request: %s → %s, %s/%s, %s pax, %s",
+                        origin, destination, departure_date, return_date, passengers, class_type)
+            logger.debug("Prompt sent to AI:\n%s", prompt)
             
             # Use Vertex AI to generate flight suggestions
-            if self.vertex_ai.is_configured and self.vertex_ai.model:
-                logger.info("🔄 Calling Vertex AI for flight generation...")
-                response = self.vertex_ai.model.generate_content(prompt)
-                if response and response.text:
-                    logger.info("✅ AI Response received!")
-                    logger.info("=" * 80)
-                    logger.info("🤖 AI FLIGHT RESPONSE")
-                    logger.info("=" * 80)
-                    logger.info("RAW AI RESPONSE:")
-                    logger.info(f"Response length: {len(response.text)} characters")
-                    logger.info("Full response:")
-                    logger.info(response.text)
-                    logger.info("=" * 80)
-                    
-                    parsed_flights = self._parse_flight_response(response.text, origin, destination, departure_date, return_date)
-                    
-                    logger.info("📋 PARSED FLIGHT DATA:")
-                    for i, flight in enumerate(parsed_flights, 1):
-                        logger.info(f"  Flight {i}: {flight.get('airline', 'N/A')} {flight.get('flight_number', 'N/A')} - ₹{flight.get('price', 0):,}")
-                    
-                    logger.info("=" * 80)
-                    return parsed_flights
-                else:
-                    logger.warning("⚠️ Empty response from AI, falling back to mock data")
+            logger.info("🔄 Calling Vertex AI for flight generation...")
+            response = self._generate_json_content(prompt, "flight")
+            if response and response.text:
+                # A short content hash keeps INFO lines traceable; the full body is DEBUG-only
+                logger.info("✅ AI flight response received (sha1=%s, %d characters)",
+                            hashlib.sha1(response.text.encode('utf-8')).hexdigest()[:12], len(response.text))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Full response:\n%s", response.text)
+                
+                parsed_flights, from_model = self._parse_flight_response(response.text, origin, destination, departure_date, return_date)
+                logger.info("📋 Parsed %d flights", len(parsed_flights))
+                # Empty results and mock/template fallbacks are not cached, so the next identical search asks the model again
+                if from_model:
+                    self._store_suggestions(cache_key, parsed_flights)
+                return parsed_flights
             else:
-                logger.warning("⚠️ Vertex AI not configured, using enhanced mock data")
+                logger.warning("⚠️ Empty response from AI, falling back to mock data")
             
             # Fallback to enhanced mock data
             logger.info("🔄 Generating enhanced mock flight data...")
             mock_data = self._generate_enhanced_flight_mock_data(origin, destination, departure_date, return_date, passengers, class_type)
             
-            logger.info("📋 MOCK FLIGHT DATA GENERATED:")
-            for i, flight in enumerate(mock_data, 1):
-                logger.info(f"  Flight {i}: {flight.get('airline', 'N/A')} {flight.get('flight_number', 'N/A')} - ₹{flight.get('price', 0):,}")
-            
+            logger.info("📋 Generated %d mock flights", len(mock_data))
             return mock_data
             
         except Exception as e:
@@ -155,57 +533,48 @@ class AIBookingDataGenerator:
                                       rooms: int = 1, guests: int = 2) -> List[Dict]:
         """Generate AI-powered hotel suggestions"""
         try:
+            # Nothing below is useful without a model, so skip prompt building entirely
+            if not (self.vertex_ai.is_configured and self.vertex_ai.model):
+                logger.warning("⚠️ Vertex AI not configured, using enhanced mock data")
+                return self._generate_enhanced_hotel_mock_data(city, check_in, check_out, rooms, guests)
+            
             # Create prompt for hotel generation
             prompt = self._create_hotel_prompt(city, check_in, check_out, rooms, guests)
+            cache_key = self._suggestion_cache_key(prompt)
+            cached = self._get_cached_suggestions(cache_key)
+            if cached is not None:
+                logger.info("♻️ Reusing cached hotel suggestions for an identical search")
+                return cached
             
-            # Log the prompt being sent to AI
-            logger.info("=" * 80)
-            logger.info("🏨 AI HOTEL GENERATION REQUEST")
-            logger.info("=" * 80)
-            logger.info(f"City: {city}")
-            logger.info(f"Check-in: {check_in} → Check-out: {check_out}")
-            logger.info(f"Rooms: {rooms}, Guests: {guests}")
-            logger.info("-" * 80)
-            logger.info("PROMPT SENT TO AI:")
-            logger.info(prompt)
-            logger.info("-" * 80)
+            # Full prompt only at DEBUG; lazy %-formatting so nothing is built when filtered out
+            logger.info("🏨 AI hotel request: %s, %s → %s, %s rooms, %s guests",
+                        city, check_in, check_out, rooms, guests)
+            logger.debug("Prompt sent to AI:\n%s", prompt)
             
             # Use Vertex AI to generate hotel suggestions
-            if self.vertex_ai.is_configured and self.vertex_ai.model:
-                logger.info("🔄 Calling Vertex AI for hotel generation...")
-                response = self.vertex_ai.model.generate_content(prompt)
-                if response and response.text:
-                    logger.info("✅ AI Response received!")
-                    logger.info("=" * 80)
-                    logger.info("🏨 AI HOTEL RESPONSE")
-                    logger.info("=" * 80)
-                    logger.info("RAW AI RESPONSE:")
-                    logger.info(f"Response length: {len(response.text)} characters")
-                    logger.info("Full response:")
-                    logger.info(response.text)
-                    logger.info("=" * 80)
-                    
-                    parsed_hotels = self._parse_hotel_response(response.text, city, check_in, check_out)
-                    
-                    logger.info("📋 PARSED HOTEL DATA:")
-                    for i, hotel in enumerate(parsed_hotels, 1):
-                        logger.info(f"  Hotel {i}: {hotel.get('name', 'N/A')} - ₹{hotel.get('price_per_night', 0):,}/night")
-                    
-                    logger.info("=" * 80)
-                    return parsed_hotels
-                else:
-                    logger.warning("⚠️ Empty response from AI, falling back to mock data")
+            logger.info("🔄 Calling Vertex AI for hotel generation...")
+            response = self._generate_json_content(prompt, "hotel")
+            if response and response.text:
+                # A short content hash keeps INFO lines traceable; the full body is DEBUG-only
+                logger.info("✅ AI hotel response received (sha1=%s, %d characters)",
+                            hashlib.sha1(response.text.encode('utf-8')).hexdigest()[:12], len(response.text))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Full response:\n%s", response.text)
+                
+                parsed_hotels, from_model = self._parse_hotel_response(response.text, city, check_in, check_out)
+                logger.info("📋 Parsed %d hotels", len(parsed_hotels))
+                # Empty results and mock/template fallbacks are not cached, so the next identical search asks the model again
+                if from_model:
+                    self._store_suggestions(cache_key, parsed_hotels)
+                return parsed_hotels
             else:
-                logger.warning("⚠️ Vertex AI not configured, using enhanced mock data")
+                logger.warning("⚠️ Empty response from AI, falling back to mock data")
             
             # Fallback to enhanced mock data
             logger.info("🔄 Generating enhanced mock hotel data...")
             mock_data = self._generate_enhanced_hotel_mock_data(city, check_in, check_out, rooms, guests)
             
-            logger.info("📋 MOCK HOTEL DATA GENERATED:")
-            for i, hotel in enumerate(mock_data, 1):
-                logger.info(f"  Hotel {i}: {hotel.get('name', 'N/A')} - ₹{hotel.get('price_per_night', 0):,}/night")
-            
+            logger.info("📋 Generated %d mock hotels", len(mock_data))
             return mock_data
             
         except Exception as e:
@@ -216,155 +585,73 @@ class AIBookingDataGenerator:
     def _create_flight_prompt(self, origin: str, destination: str, departure_date: str, 
                              return_date: str = None, passengers: int = 1, class_type: str = "Economy") -> str:
         """Create prompt for flight data generation"""
-        return f"""
-You are a travel booking expert. Generate realistic flight options for the following search criteria.
-
+        # Static instructions first so Vertex AI's prefix cache can reuse them across searches
+        return _FLIGHT_PROMPT_INSTRUCTIONS + f"""
 SEARCH CRITERIA:
 - Origin: {origin}
 - Destination: {destination}
 - Departure Date: {departure_date}
 - Return Date: {return_date if return_date else 'One-way trip'}
 - Passengers: {passengers}
-- Class: {class_type}
-
-Generate exactly 3 realistic flight options with the following details for each flight:
-- flight_id: unique identifier
-- airline: realistic airline name
-- flight_number: realistic flight number
-- origin: {origin}
-- destination: {destination}
-- departure_time: realistic departure time (HH:MM format)
-- arrival_time: realistic arrival time (HH:MM format)
-- duration: realistic flight duration
-- price: realistic price in INR (₹)
-- currency: INR
-- class_type: {class_type}
-- available_seats: realistic number (5-25)
-- stops: "Non-stop" or "1 stop" or "2 stops"
-- aircraft: realistic aircraft type
-
-IMPORTANT JSON FORMATTING RULES:
-1. Return ONLY a valid JSON array starting with [ and ending with ]
-2. Each flight object must be properly formatted with double quotes
-3. All string values must be enclosed in double quotes
-4. No trailing commas
-5. No newlines within string values
-6. No additional text before or after the JSON array
-
-Example format:
-[
-  {{
-    "flight_id": "AI1001",
-    "airline": "Air India",
-    "flight_number": "AI1001",
-    "origin": "DEL",
-    "destination": "BOM",
-    "departure_time": "08:30",
-    "arrival_time": "10:45",
-    "duration": "2h 15m",
-    "price": 5000,
-    "currency": "INR",
-    "class_type": "Economy",
-    "available_seats": 15,
-    "stops": "Non-stop",
-    "aircraft": "Boeing 737"
-  }}
-]
-
-Return ONLY the JSON array, no other text.
-"""
+- Class: {class_type}"""
     
     def _create_hotel_prompt(self, city: str, check_in: str, check_out: str, 
                             rooms: int = 1, guests: int = 2) -> str:
         """Create prompt for hotel data generation"""
-        return f"""
-You are a hotel booking expert. Generate realistic hotel options for the following search criteria.
-
+        # Static instructions first so Vertex AI's prefix cache can reuse them across searches
+        return _HOTEL_PROMPT_INSTRUCTIONS + f"""
 SEARCH CRITERIA:
 - City: {city}
 - Check-in: {check_in}
 - Check-out: {check_out}
 - Rooms: {rooms}
-- Guests: {guests}
-
-Generate exactly 3 realistic hotel options with the following details for each hotel:
-- hotel_id: unique identifier
-- name: realistic hotel name in {city}
-- city: {city}
-- address: realistic address in {city}
-- star_rating: 3-5 stars
-- price_per_night: realistic price in INR (₹)
-- currency: INR
-- check_in: {check_in}
-- check_out: {check_out}
-- total_price: calculated total for stay
-- amenities: array of realistic amenities
-- room_type: realistic room type
-- available_rooms: realistic number (1-8)
-- cancellation_policy: realistic policy
-- rating: realistic rating (3.5-4.8)
-- reviews_count: realistic number (50-500)
-
-IMPORTANT JSON FORMATTING RULES:
-1. Return ONLY a valid JSON array starting with [ and ending with ]
-2. Each hotel object must be properly formatted with double quotes
-3. All string values must be enclosed in double quotes
-4. No trailing commas
-5. No newlines within string values
-6. No additional text before or after the JSON array
-
-Example format:
-[
-  {{
-    "hotel_id": "hotel_1001",
-    "name": "Taj Palace",
-    "city": "{city}",
-    "address": "123 Main Street, {city}",
-    "star_rating": 4,
-    "price_per_night": 3000,
-    "currency": "INR",
-    "check_in": "{check_in}",
-    "check_out": "{check_out}",
-    "total_price": 15000,
-    "amenities": ["WiFi", "Pool", "Gym", "Restaurant"],
-    "room_type": "Deluxe Room",
-    "available_rooms": 5,
-    "cancellation_policy": "Free cancellation until 24 hours before check-in",
-    "rating": 4.2,
-    "reviews_count": 150
-  }}
-]
-
-Return ONLY the JSON array, no other text.
-"""
+- Guests: {guests}"""
+    
+    def _parse_json_items(self, response_text: str) -> Tuple[List[Dict], bool]:
+        """Parse a JSON array response, falling back to the repair chain only when it is malformed
+        
+        Returns the items and whether they came from the model's output (False when
+        nothing parsed or the options were built from templates).
+        """
+        cleaned_text = response_text.strip()
+        logger.debug("Original response length: %d characters", len(response_text))
+        
+        # Models without a JSON mime type often wrap the array in a markdown code fence
+        fence_match = _RE_CODE_FENCE.match(cleaned_text)
+        if fence_match:
+            cleaned_text = fence_match.group(1)
+            logger.debug("Removed markdown code fence")
+        
+        try:
+            # A complete response is valid JSON as-is; only truncated or malformed output needs repair
+            items = _json_loads(cleaned_text)
+            if isinstance(items, list):
+                return self._expand_to_three_options(items), bool(items)
+        except json.JSONDecodeError as e:
+            logger.debug("Direct parsing failed, repairing response: %s", e)
+        
+        # Additional cleaning for common AI response issues
+        cleaned_text = self._clean_json_response(cleaned_text)
+        logger.debug("Cleaned response length: %d characters, preview: %.200s...", len(cleaned_text), cleaned_text)
+        
+        # Parse JSON with safe parsing
+        return self._safe_json_parse(cleaned_text)
     
     def _clean_json_response(self, text: str) -> str:
         """Clean AI response text to make it valid JSON"""
         try:
-            # Remove any text before the first '[' or '{'
-            start_idx = -1
-            for i, char in enumerate(text):
-                if char in '[{':
-                    start_idx = i
-                    break
-            
-            if start_idx != -1:
-                text = text[start_idx:]
+            # Remove any text before the first '[' or '{' (str.find scans in C)
+            starts = [idx for idx in (text.find('['), text.find('{')) if idx != -1]
+            if starts:
+                text = text[min(starts):]
             
             # Remove any text after the last ']' or '}'
-            end_idx = -1
-            for i in range(len(text) - 1, -1, -1):
-                if text[i] in ']}':
-                    end_idx = i + 1
-                    break
-            
+            end_idx = max(text.rfind(']'), text.rfind('}'))
             if end_idx != -1:
-                text = text[:end_idx]
+                text = text[:end_idx + 1]
             
-            # Fix common JSON issues
-            text = text.replace('\n', ' ')  # Remove newlines
-            text = text.replace('\r', ' ')  # Remove carriage returns
-            text = text.replace('\t', ' ')  # Remove tabs
+            # Newlines, carriage returns and tabs become spaces in one pass
+            text = text.translate(_WHITESPACE_TO_SPACE)
             
             # Fix unterminated strings by adding quotes
             text = self._fix_unterminated_strings(text)
@@ -382,12 +669,10 @@ Return ONLY the JSON array, no other text.
         """Fix unterminated strings in JSON"""
         try:
             # Simple approach: find and fix common unterminated string patterns
-            import re
-            
             # Fix strings that end with newline or are not properly quoted
             # This is a basic fix - more sophisticated parsing could be added
-            text = re.sub(r'"([^"]*?)\n', r'"\1"', text)
-            text = re.sub(r'"([^"]*?)$', r'"\1"', text)
+            text = _RE_UNTERM_NL.sub(r'"\1"', text)
+            text = _RE_UNTERM_EOL.sub(r'"\1"', text)
             
             return text
         except Exception:
@@ -396,36 +681,46 @@ Return ONLY the JSON array, no other text.
     def _fix_trailing_commas(self, text: str) -> str:
         """Fix trailing commas in JSON"""
         try:
-            import re
             # Remove trailing commas before closing brackets/braces
-            text = re.sub(r',(\s*[}\]])', r'\1', text)
+            text = _RE_TRAILING_COMMA.sub(r'\1', text)
             return text
         except Exception:
             return text
     
-    def _safe_json_parse(self, text: str) -> List[Dict]:
-        """Safely parse JSON with multiple fallback strategies"""
-        logger.info("🔧 SAFE JSON PARSING")
-        logger.info("-" * 30)
+    def _safe_json_parse(self, text: str) -> Tuple[List[Dict], bool]:
+        """Safely parse JSON with multiple fallback strategies; the flag is False for template or empty results"""
+        logger.debug("Safe JSON parsing")
         
         try:
             # Try direct parsing first
-            logger.info("Attempt 1: Direct JSON parsing...")
-            result = json.loads(text)
-            logger.info(f"✅ Direct parsing successful! Found {len(result)} items")
-            return result
+            logger.debug("Attempt 1: direct JSON parsing")
+            result = _json_loads(text)
+            logger.debug("Direct parsing found %d items", len(result))
+            return result, bool(result)
         except json.JSONDecodeError as e:
-            logger.warning(f"❌ Direct parsing failed: {str(e)}")
+            logger.debug("Direct parsing failed: %s", e)
+        
+        if repair_json:
+            try:
+                # One repair pass handles truncation, trailing commas and bare keys together
+                logger.debug("Attempt 1b: one-pass JSON repair")
+                result = _json_loads(repair_json(text))
+                if isinstance(result, dict):
+                    result = [result]
+                if isinstance(result, list) and result:
+                    logger.debug("Repaired parsing found %d items", len(result))
+                    return self._expand_to_three_options(result), True
+            except (json.JSONDecodeError, ValueError) as e:
+                logger.debug("Repaired parsing failed: %s", e)
             
         try:
             # Try to find and extract JSON array
-            logger.info("Attempt 2: Extract JSON array pattern...")
-            import re
+            logger.debug("Attempt 2: extract JSON array pattern")
             # Look for array pattern (including incomplete ones)
-            array_match = re.search(r'\[.*', text, re.DOTALL)
+            array_match = _RE_ARRAY_START.search(text)
             if array_match:
                 array_text = array_match.group()
-                logger.info(f"Found array pattern, length: {len(array_text)}")
+                logger.debug("Found array pattern, length: %d", len(array_text))
                 
                 # Try to fix incomplete array
                 if not array_text.endswith(']'):
@@ -434,88 +729,96 @@ Return ONLY the JSON array, no other text.
                     close_brackets = array_text.count(']')
                     if open_brackets > close_brackets:
                         array_text += ']' * (open_brackets - close_brackets)
-                        logger.info(f"Added {open_brackets - close_brackets} closing brackets")
+                        logger.debug("Added %d closing brackets", open_brackets - close_brackets)
                 
-                result = json.loads(array_text)
-                logger.info(f"✅ Array extraction successful! Found {len(result)} items")
+                result = _json_loads(array_text)
+                logger.debug("Array extraction found %d items", len(result))
                 
-                # If we got less than 3 items, try to expand to 3
-                if len(result) < 3 and len(result) > 0:
-                    logger.info(f"Expanding {len(result)} items to 3 options")
-                    expanded_result = []
-                    for i in range(3):
-                        if i < len(result):
-                            # Use existing item
-                            expanded_result.append(result[i])
-                        else:
-                            # Create additional item based on first item
-                            base_item = result[0].copy()
-                            if 'hotel_id' in base_item:
-                                # Hotel expansion
-                                base_item['hotel_id'] = f"hotel_{1000 + i}"
-                                base_item['name'] = f"{base_item.get('name', 'Hotel')} {i+1}"
-                                base_item['price_per_night'] = base_item.get('price_per_night', 3000) + (i * 1500)
-                                base_item['star_rating'] = base_item.get('star_rating', 4) + (i % 2)
-                            elif 'flight_id' in base_item:
-                                # Flight expansion
-                                base_item['flight_id'] = f"flight_{1000 + i}"
-                                base_item['airline'] = f"{base_item.get('airline', 'Airline')} {i+1}"
-                                base_item['flight_number'] = f"FL{1000 + i}"
-                                base_item['price'] = base_item.get('price', 5000) + (i * 2000)
-                                base_item['departure_time'] = f"{8 + i * 2:02d}:30"
-                                base_item['arrival_time'] = f"{10 + i * 2:02d}:45"
-                            
-                            expanded_result.append(base_item)
-                    
-                    logger.info(f"✅ Expanded to {len(expanded_result)} options")
-                    return expanded_result
-                
-                return result
+                return self._expand_to_three_options(result), bool(result)
             else:
-                logger.warning("No array pattern found")
+                logger.debug("No array pattern found")
         except json.JSONDecodeError as e:
-            logger.warning(f"❌ Array extraction failed: {str(e)}")
+            logger.debug("Array extraction failed: %s", e)
             
         try:
             # Try to fix common issues and parse again
-            logger.info("Attempt 3: Fix JSON issues and parse...")
+            logger.debug("Attempt 3: fix JSON issues and parse")
             fixed_text = self._fix_json_issues(text)
-            logger.info(f"Fixed text length: {len(fixed_text)}")
+            logger.debug("Fixed text length: %d", len(fixed_text))
+            # Stdlib json is the last-resort parser: it accepts input orjson rejects (NaN, Infinity, lone surrogates)
             result = json.loads(fixed_text)
-            logger.info(f"✅ Fixed JSON parsing successful! Found {len(result)} items")
-            return result
+            logger.debug("Fixed JSON parsing found %d items", len(result))
+            return result, bool(result)
         except json.JSONDecodeError as e:
-            logger.warning(f"❌ Fixed JSON parsing failed: {str(e)}")
+            logger.debug("Fixed JSON parsing failed: %s", e)
             
         try:
             # Last attempt: Create minimal valid JSON from partial data
-            logger.info("Attempt 4: Create minimal valid JSON from partial data...")
+            logger.debug("Attempt 4: build minimal JSON from partial data")
             minimal_data = self._create_minimal_json_from_partial(text)
             if minimal_data:
-                logger.info(f"✅ Minimal JSON creation successful! Found {len(minimal_data)} items")
-                return minimal_data
+                logger.debug("Minimal JSON creation found %d items", len(minimal_data))
+                return minimal_data, False
         except Exception as e:
-            logger.warning(f"❌ Minimal JSON creation failed: {str(e)}")
+            logger.debug("Minimal JSON creation failed: %s", e)
         
         # If all else fails, return empty list
         logger.warning("❌ All JSON parsing attempts failed, returning empty list")
-        return []
+        return [], False
+    
+    def _expand_to_three_options(self, result: List[Dict]) -> List[Dict]:
+        """Pad a 1-2 item result to 3 options by varying copies of the first item"""
+        if len(result) < 3 and len(result) > 0:
+            logger.debug("Expanding %d items to 3 options", len(result))
+            expanded_result = []
+            for i in range(3):
+                if i < len(result):
+                    # Use existing item
+                    expanded_result.append(result[i])
+                else:
+                    # Create additional item based on first item, merged with its varied fields in one step
+                    base_item = result[0]
+                    if 'hotel_id' in base_item:
+                        # Hotel expansion
+                        override = {
+                            'hotel_id': f"hotel_{1000 + i}",
+                            'name': f"{base_item.get('name', 'Hotel')} {i+1}",
+                            'price_per_night': base_item.get('price_per_night', 3000) + (i * 1500),
+                            'star_rating': base_item.get('star_rating', 4) + (i % 2)
+                        }
+                    elif 'flight_id' in base_item:
+                        # Flight expansion
+                        override = {
+                            'flight_id': f"flight_{1000 + i}",
+                            'airline': f"{base_item.get('airline', 'Airline')} {i+1}",
+                            'flight_number': f"FL{1000 + i}",
+                            'price': base_item.get('price', 5000) + (i * 2000),
+                            'departure_time': f"{8 + i * 2:02d}:30",
+                            'arrival_time': f"{10 + i * 2:02d}:45"
+                        }
+                    else:
+                        override = {}
+                    
+                    expanded_result.append({**base_item, **override})
+            
+            logger.debug("Expanded to %d options", len(expanded_result))
+            return expanded_result
+        
+        return result
     
     def _fix_json_issues(self, text: str) -> str:
         """Fix common JSON issues"""
-        import re
-        
         # Fix unescaped quotes in strings
-        text = re.sub(r'"([^"]*)"([^"]*)"([^"]*)"', r'"\1\2\3"', text)
+        text = _RE_INNER_QUOTES.sub(r'"\1\2\3"', text)
         
         # Fix missing quotes around keys
-        text = re.sub(r'(\w+):', r'"\1":', text)
+        text = _RE_BARE_KEY.sub(r'"\1":', text)
         
         # Fix single quotes to double quotes
         text = text.replace("'", '"')
         
         # Fix trailing commas
-        text = re.sub(r',(\s*[}\]])', r'\1', text)
+        text = _RE_TRAILING_COMMA.sub(r'\1', text)
         
         # Fix unterminated strings by adding closing quotes
         text = self._fix_unterminated_strings(text)
@@ -548,11 +851,9 @@ Return ONLY the JSON array, no other text.
     def _create_minimal_json_from_partial(self, text: str) -> List[Dict]:
         """Create minimal valid JSON from partial/truncated data"""
         try:
-            import re
-            
             # Look for any object-like patterns in the text
             # Find patterns that look like: "key": "value"
-            key_value_patterns = re.findall(r'"([^"]+)":\s*"([^"]*)"', text)
+            key_value_patterns = _RE_KEY_VALUE.findall(text)
             
             if key_value_patterns:
                 # Create a minimal object with the found key-value pairs
@@ -565,66 +866,25 @@ Return ONLY the JSON array, no other text.
                 is_flight = 'flight_id' in minimal_obj
                 
                 if is_hotel or is_flight:
-                    # Generate exactly 3 options based on the partial data
-                    options = []
-                    
-                    for i in range(3):
-                        option = {}
-                        
-                        if is_hotel:
-                            # Create 3 unique hotel options
-                            hotel_names = ['Taj Palace', 'Oberoi Hotel', 'ITC Maratha']
-                            room_types = ['Deluxe Room', 'Executive Suite', 'Presidential Suite']
-                            amenity_sets = [
-                                ['WiFi', 'Pool', 'Gym', 'Restaurant'],
-                                ['WiFi', 'Spa', 'Business Center', 'Restaurant', 'Pool'],
-                                ['WiFi', 'Pool', 'Gym', 'Restaurant', 'Spa', 'Concierge', 'Room Service']
-                            ]
-                            
-                            option = {
-                                'hotel_id': f"hotel_{1000 + i}",
-                                'name': hotel_names[i] if i < len(hotel_names) else f'Hotel Option {i+1}',
-                                'city': minimal_obj.get('city', 'Unknown City'),
-                                'address': f"{100 + i*50} Main Street, {minimal_obj.get('city', 'Unknown City')}",
-                                'star_rating': 3 + i,  # 3, 4, 5 stars
-                                'price_per_night': 2000 + (i * 2000) + (i * 500),  # 2000, 4500, 7000
-                                'currency': 'INR',
-                                'check_in': minimal_obj.get('check_in', '2025-09-20'),
-                                'check_out': minimal_obj.get('check_out', '2025-09-25'),
-                                'total_price': (2000 + (i * 2000) + (i * 500)) * 5,  # Assuming 5 nights
-                                'amenities': amenity_sets[i] if i < len(amenity_sets) else ['WiFi', 'Pool', 'Gym', 'Restaurant', 'Spa'],
-                                'room_type': room_types[i] if i < len(room_types) else 'Deluxe Room',
-                                'available_rooms': 8 - i*2,
-                                'cancellation_policy': 'Free cancellation until 24 hours before check-in',
-                                'rating': 4.0 + (i * 0.3),
-                                'reviews_count': 100 + (i * 100)
-                            }
-                        else:
-                            # Create 3 unique flight options
-                            airlines = ['Air India', 'IndiGo', 'SpiceJet']
-                            flight_codes = ['AI', '6E', 'SG']
-                            aircraft_types = ['Boeing 737', 'Airbus A320', 'Boeing 777']
-                            
-                            option = {
-                                'flight_id': f"flight_{1000 + i}",
-                                'airline': airlines[i] if i < len(airlines) else f'Airline {i+1}',
-                                'flight_number': f"{flight_codes[i] if i < len(flight_codes) else 'FL'}{1000 + i}",
-                                'origin': minimal_obj.get('origin', 'DEL'),
-                                'destination': minimal_obj.get('destination', 'BOM'),
-                                'departure_time': f"{6 + i * 3:02d}:{30 + i*15:02d}",  # 6:30, 9:45, 12:00
-                                'arrival_time': f"{8 + i * 3:02d}:{45 + i*10:02d}",  # 8:45, 11:55, 15:00
-                                'duration': f"{2 + i}h {15 + i*15}m",
-                                'price': 4000 + (i * 2500) + (i * 500),  # 4000, 7000, 10000
-                                'currency': 'INR',
-                                'class_type': 'Economy',
-                                'available_seats': 25 - i*5,
-                                'stops': 'Non-stop' if i == 0 else f"{i} stop",
-                                'aircraft': aircraft_types[i] if i < len(aircraft_types) else 'Boeing 737'
-                            }
-                        
-                        options.append(option)
+                    # Generate exactly 3 options from the prebuilt templates; only the search fields vary
+                    if is_hotel:
+                        city = minimal_obj.get('city', 'Unknown City')
+                        check_in = minimal_obj.get('check_in', '2025-09-20')
+                        check_out = minimal_obj.get('check_out', '2025-09-25')
+                        options = [
+                            {**template, 'city': city, 'address': f"{100 + i*50} Main Street, {city}",
+                             'check_in': check_in, 'check_out': check_out, 'amenities': list(template['amenities'])}
+                            for i, template in enumerate(_MINIMAL_HOTEL_TEMPLATES)
+                        ]
+                    else:
+                        origin = minimal_obj.get('origin', 'DEL')
+                        destination = minimal_obj.get('destination', 'BOM')
+                        options = [
+                            {**template, 'origin': origin, 'destination': destination}
+                            for template in _MINIMAL_FLIGHT_TEMPLATES
+                        ]
                     
-                    logger.info(f"Created {len(options)} minimal options from partial data")
+                    logger.debug("Created %d minimal options from partial data", len(options))
                     return options
             
             return []
@@ -633,93 +893,49 @@ Return ONLY the JSON array, no other text.
             return []
     
     def _parse_flight_response(self, response_text: str, origin: str, destination: str, 
-                              departure_date: str, return_date: str = None) -> List[Dict]:
-        """Parse AI response for flight data"""
+                              departure_date: str, return_date: str = None) -> Tuple[List[Dict], bool]:
+        """Parse AI response for flight data; the flag is False when the options did not come from the model"""
         try:
-            logger.info("🔍 PARSING FLIGHT RESPONSE")
-            logger.info("-" * 40)
-            
-            # Clean the response text
-            cleaned_text = response_text.strip()
-            logger.info(f"Original response length: {len(response_text)} characters")
-            
-            # Try to extract JSON from the response
-            if cleaned_text.startswith('```json'):
-                cleaned_text = cleaned_text[7:]
-                logger.info("Removed ```json prefix")
-            if cleaned_text.endswith('```'):
-                cleaned_text = cleaned_text[:-3]
-                logger.info("Removed ``` suffix")
-            
-            # Additional cleaning for common AI response issues
-            cleaned_text = self._clean_json_response(cleaned_text)
-            logger.info(f"Cleaned response length: {len(cleaned_text)} characters")
-            logger.info(f"Cleaned response preview: {cleaned_text[:200]}...")
-            
-            # Parse JSON with safe parsing
-            logger.info("Attempting JSON parsing...")
-            flights = self._safe_json_parse(cleaned_text)
-            logger.info(f"Successfully parsed {len(flights)} flights")
+            flights, from_model = self._parse_json_items(response_text)
+            logger.debug("Successfully parsed %d flights", len(flights))
             
             # Validate and enhance the response
             validated_flights = self._validate_flight_data(flights, origin, destination, departure_date, return_date)
-            logger.info(f"Validated {len(validated_flights)} flights")
+            logger.debug("Validated %d flights", len(validated_flights))
             
-            return validated_flights
+            return validated_flights, from_model
             
         except json.JSONDecodeError as e:
             logger.error(f"❌ Failed to parse flight response as JSON: {str(e)}")
             logger.error(f"Response text: {response_text[:500]}...")
             logger.info("🔄 Falling back to enhanced mock data...")
-            return self._generate_enhanced_flight_mock_data(origin, destination, departure_date, return_date)
+            return self._generate_enhanced_flight_mock_data(origin, destination, departure_date, return_date), False
         except Exception as e:
             logger.error(f"❌ Error parsing flight response: {str(e)}")
             logger.info("🔄 Falling back to enhanced mock data...")
-            return self._generate_enhanced_flight_mock_data(origin, destination, departure_date, return_date)
+            return self._generate_enhanced_flight_mock_data(origin, destination, departure_date, return_date), False
     
-    def _parse_hotel_response(self, response_text: str, city: str, check_in: str, check_out: str) -> List[Dict]:
-        """Parse AI response for hotel data"""
+    def _parse_hotel_response(self, response_text: str, city: str, check_in: str, check_out: str) -> Tuple[List[Dict], bool]:
+        """Parse AI response for hotel data; the flag is False when the options did not come from the model"""
         try:
-            logger.info("🔍 PARSING HOTEL RESPONSE")
-            logger.info("-" * 40)
-            
-            # Clean the response text
-            cleaned_text = response_text.strip()
-            logger.info(f"Original response length: {len(response_text)} characters")
-            
-            # Try to extract JSON from the response
-            if cleaned_text.startswith('```json'):
-                cleaned_text = cleaned_text[7:]
-                logger.info("Removed ```json prefix")
-            if cleaned_text.endswith('```'):
-                cleaned_text = cleaned_text[:-3]
-                logger.info("Removed ``` suffix")
-            
-            # Additional cleaning for common AI response issues
-            cleaned_text = self._clean_json_response(cleaned_text)
-            logger.info(f"Cleaned response length: {len(cleaned_text)} characters")
-            logger.info(f"Cleaned response preview: {cleaned_text[:200]}...")
-            
-            # Parse JSON with safe parsing
-            logger.info("Attempting JSON parsing...")
-            hotels = self._safe_json_parse(cleaned_text)
-            logger.info(f"Successfully parsed {len(hotels)} hotels")
+            hotels, from_model = self._parse_json_items(response_text)
+            logger.debug("Successfully parsed %d hotels", len(hotels))
             
             # Validate and enhance the response
             validated_hotels = self._validate_hotel_data(hotels, city, check_in, check_out)
-            logger.info(f"Validated {len(validated_hotels)} hotels")
+            logger.debug("Validated %d hotels", len(validated_hotels))
             
-            return validated_hotels
+            return validated_hotels, from_model
             
         except json.JSONDecodeError as e:
             logger.error(f"❌ Failed to parse hotel response as JSON: {str(e)}")
             logger.error(f"Response text: {response_text[:500]}...")
             logger.info("🔄 Falling back to enhanced mock data...")
-            return self._generate_enhanced_hotel_mock_data(city, check_in, check_out)
+            return self._generate_enhanced_hotel_mock_data(city, check_in, check_out), False
         except Exception as e:
             logger.error(f"❌ Error parsing hotel response: {str(e)}")
             logger.info("🔄 Falling back to enhanced mock data...")
-            return self._generate_enhanced_hotel_mock_data(city, check_in, check_out)
+            return self._generate_enhanced_hotel_mock_data(city, check_in, check_out), False
     
     def _validate_flight_data(self, flights: List[Dict], origin: str, destination: str, 
                              departure_date: str, return_date: str = None) -> List[Dict]:
@@ -727,58 +943,42 @@ Return ONLY the JSON array, no other text.
         validated_flights = []
         
         for flight in flights:
-            # Ensure required fields exist
-            validated_flight = {
-                "flight_id": flight.get("flight_id", f"FL{random.randint(1000, 9999)}"),
-                "airline": flight.get("airline", "Unknown Airline"),
-                "flight_number": flight.get("flight_number", f"FL{random.randint(100, 999)}"),
-                "origin": origin,
-                "destination": destination,
-                "departure_time": flight.get("departure_time", "08:00"),
-                "arrival_time": flight.get("arrival_time", "10:00"),
-                "duration": flight.get("duration", "2h 00m"),
-                "price": flight.get("price", 5000),
-                "currency": "INR",
-                "class_type": flight.get("class_type", "Economy"),
-                "available_seats": flight.get("available_seats", 15),
-                "stops": flight.get("stops", "Non-stop"),
-                "aircraft": flight.get("aircraft", "Boeing 737")
-            }
+            # Keep only the known fields, defaulting the missing ones, then pin the search fields
+            validated_flight = {key: flight.get(key, default) for key, default in _FLIGHT_DEFAULTS.items()}
+            validated_flight.update(origin=origin, destination=destination, currency="INR")
+            if "flight_id" not in flight:
+                validated_flight["flight_id"] = f"FL{random.randint(1000, 9999)}"
+            if "flight_number" not in flight:
+                validated_flight["flight_number"] = f"FL{random.randint(100, 999)}"
             validated_flights.append(validated_flight)
         
         return validated_flights
     
     def _validate_hotel_data(self, hotels: List[Dict], city: str, check_in: str, check_out: str) -> List[Dict]:
         """Validate and enhance hotel data"""
+        if not hotels:
+            return []
+        
         validated_hotels = []
+        # The stay length and the city-specific defaults are the same for every hotel
+        try:
+            nights = _ymd_to_ordinal(check_out) - _ymd_to_ordinal(check_in)
+        except (TypeError, ValueError):
+            # Still show the options, but make the one-night price visible in the logs
+            logger.warning("⚠️ Invalid stay dates %r → %r, pricing hotels for 1 night", check_in, check_out)
+            nights = 1
+        defaults = {**_HOTEL_DEFAULTS, "name": f"Hotel in {city}", "address": f"123 Main Street, {city}"}
         
         for hotel in hotels:
+            # Keep only the known fields, defaulting the missing ones, then pin the search fields
+            validated_hotel = {key: hotel.get(key, default) for key, default in defaults.items()}
+            validated_hotel.update(city=city, currency="INR", check_in=check_in, check_out=check_out)
             # Calculate total price
-            price_per_night = hotel.get("price_per_night", 3000)
-            check_in_date = datetime.strptime(check_in, "%Y-%m-%d")
-            check_out_date = datetime.strptime(check_out, "%Y-%m-%d")
-            nights = (check_out_date - check_in_date).days
-            total_price = price_per_night * nights
-            
-            # Ensure required fields exist
-            validated_hotel = {
-                "hotel_id": hotel.get("hotel_id", f"hotel_{random.randint(1000, 9999)}"),
-                "name": hotel.get("name", f"Hotel in {city}"),
-                "city": city,
-                "address": hotel.get("address", f"123 Main Street, {city}"),
-                "star_rating": hotel.get("star_rating", 4),
-                "price_per_night": price_per_night,
-                "currency": "INR",
-                "check_in": check_in,
-                "check_out": check_out,
-                "total_price": total_price,
-                "amenities": hotel.get("amenities", ["WiFi", "Pool", "Gym", "Restaurant"]),
-                "room_type": hotel.get("room_type", "Deluxe Room"),
-                "available_rooms": hotel.get("available_rooms", 5),
-                "cancellation_policy": hotel.get("cancellation_policy", "Free cancellation until 24 hours before check-in"),
-                "rating": hotel.get("rating", 4.2),
-                "reviews_count": hotel.get("reviews_count", 150)
-            }
+            validated_hotel["total_price"] = validated_hotel["price_per_night"] * nights
+            if "hotel_id" not in hotel:
+                validated_hotel["hotel_id"] = f"hotel_{random.randint(1000, 9999)}"
+            if "amenities" not in hotel:
+                validated_hotel["amenities"] = list(_DEFAULT_HOTEL_AMENITIES)
             validated_hotels.append(validated_hotel)
         
         return validated_hotels
@@ -787,159 +987,32 @@ Return ONLY the JSON array, no other text.
                                            departure_date: str, return_date: str = None, 
                                            passengers: int = 1, class_type: str = "Economy") -> List[Dict]:
         """Generate enhanced mock flight data with destination-specific information"""
-        flights = []
-        
-        # Destination-specific airline and flight data
-        destination_airlines = {
-            'BOM': ['Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir'],
-            'DEL': ['Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir'],
-            'BLR': ['Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir'],
-            'MAA': ['Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir'],
-            'CCU': ['Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir'],
-            'HYD': ['Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir'],
-            'PNQ': ['Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir'],
-            'AMD': ['Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir'],
-            'JAI': ['Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir'],
-            'GOI': ['Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir'],
-            'COK': ['Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir']
-        }
-        
-        # Get airlines for destination or use default
-        airlines = destination_airlines.get(destination, ['Air India', 'IndiGo', 'SpiceJet', 'Vistara', 'GoAir'])
-        flight_codes = ['AI', '6E', 'SG', 'UK', 'G8']
-        
-        # Ensure we have at least 3 unique airlines
-        unique_airlines = airlines[:3] if len(airlines) >= 3 else airlines + ['Jet Airways', 'Air Asia', 'TruJet'][:3-len(airlines)]
-        unique_codes = flight_codes[:3] if len(flight_codes) >= 3 else flight_codes + ['9W', 'I5', '2T'][:3-len(flight_codes)]
-        
-        for i in range(3):
-            airline = unique_airlines[i]
-            flight_code = unique_codes[i]
-            
-            # Generate realistic times with more variation
-            departure_hour = 6 + i * 3  # 6, 9, 12
-            arrival_hour = departure_hour + 2 + (i * 0.5)
-            
-            # Add some randomness to make each flight unique
-            import random
-            random.seed(hash(f"{origin}{destination}{i}"))  # Deterministic but unique per route
-            
-            flight = {
-                "flight_id": f"{flight_code}{1000 + i}",
-                "airline": airline,
-                "flight_number": f"{flight_code}{1000 + i}",
-                "origin": origin,
-                "destination": destination,
-                "departure_time": f"{departure_hour:02d}:{30 + i*15:02d}",
-                "arrival_time": f"{int(arrival_hour):02d}:{45 + i*10:02d}",
-                "duration": f"{2 + i}h {15 + i*15}m",
-                "price": 4000 + (i * 2500) + random.randint(0, 1000),
-                "currency": "INR",
-                "class_type": class_type,
-                "available_seats": 25 - i*5,
-                "stops": "Non-stop" if i == 0 else f"{i} stop",
-                "aircraft": ["Boeing 737", "Airbus A320", "Boeing 777"][i]
-            }
-            flights.append(flight)
-        
-        return flights
+        # Fresh dicts so callers can't modify the cached options
+        return [dict(flight) for flight in _enhanced_flight_mock_options(origin, destination, class_type)]
     
     def _generate_enhanced_hotel_mock_data(self, city: str, check_in: str, check_out: str, 
                                           rooms: int = 1, guests: int = 2) -> List[Dict]:
         """Generate enhanced mock hotel data with city-specific information"""
-        hotels = []
-        
-        # City-specific hotel names and characteristics
-        city_hotels = {
-            'Mumbai': ['Taj Palace', 'Oberoi Hotel', 'ITC Maratha', 'Le Meridien', 'Holiday Inn', 'Radisson Blu'],
-            'Delhi': ['The Leela Palace', 'Taj Palace', 'The Oberoi', 'ITC Maurya', 'Holiday Inn', 'Radisson Blu'],
-            'Bangalore': ['Taj West End', 'The Leela Palace', 'ITC Gardenia', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'],
-            'Chennai': ['Taj Coromandel', 'The Leela Palace', 'ITC Grand Chola', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'],
-            'Kolkata': ['Taj Bengal', 'The Oberoi', 'ITC Sonar', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'],
-            'Hyderabad': ['Taj Falaknuma Palace', 'The Leela Palace', 'ITC Kakatiya', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'],
-            'Pune': ['Taj Blue Diamond', 'The Leela Palace', 'ITC Maratha', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'],
-            'Ahmedabad': ['Taj Skyline', 'The Leela Palace', 'ITC Narmada', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'],
-            'Jaipur': ['Taj Rambagh Palace', 'The Leela Palace', 'ITC Rajputana', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'],
-            'Goa': ['Taj Exotica', 'The Leela Palace', 'ITC Maratha', 'JW Marriott', 'Holiday Inn', 'Radisson Blu'],
-            'Kerala': ['Taj Malabar', 'The Leela Palace', 'ITC Grand Chola', 'JW Marriott', 'Holiday Inn', 'Radisson Blu']
-        }
-        
-        # Get hotels for city or use default
-        city_hotel_names = city_hotels.get(city, ['Taj Palace', 'Oberoi Hotel', 'ITC Maratha', 'Le Meridien', 'Holiday Inn', 'Radisson Blu'])
-        
-        # Ensure we have at least 3 unique hotels
-        unique_hotels = city_hotel_names[:3] if len(city_hotel_names) >= 3 else city_hotel_names + ['Marriott', 'Hilton', 'Hyatt'][:3-len(city_hotel_names)]
-        
-        # Calculate total price
-        check_in_date = datetime.strptime(check_in, "%Y-%m-%d")
-        check_out_date = datetime.strptime(check_out, "%Y-%m-%d")
-        nights = (check_out_date - check_in_date).days
-        
-        # Add some randomness to make each hotel unique
-        import random
-        
-        for i in range(3):
-            random.seed(hash(f"{city}{check_in}{i}"))  # Deterministic but unique per city/date
-            hotel_name = unique_hotels[i]
-            base_price = 2000 + (i * 2000)  # 2000, 4000, 6000
-            price_per_night = base_price + random.randint(0, 1000)
-            total_price = price_per_night * nights
-            
-            # Different room types and amenities for variety
-            room_types = ["Deluxe Room", "Executive Suite", "Presidential Suite"]
-            amenity_sets = [
-                ["WiFi", "Pool", "Gym", "Restaurant"],
-                ["WiFi", "Spa", "Business Center", "Restaurant", "Pool"],
-                ["WiFi", "Pool", "Gym", "Restaurant", "Spa", "Concierge", "Room Service"]
-            ]
-            
-            hotel = {
-                "hotel_id": f"hotel_{1000 + i}",
-                "name": hotel_name,
-                "city": city,
-                "address": f"{100 + i*50} Main Street, {city}",
-                "star_rating": 3 + i,  # 3, 4, 5 stars
-                "price_per_night": price_per_night,
-                "currency": "INR",
-                "check_in": check_in,
-                "check_out": check_out,
-                "total_price": total_price,
-                "amenities": amenity_sets[i],
-                "room_type": room_types[i],
-                "available_rooms": 8 - i*2,
-                "cancellation_policy": "Free cancellation until 24 hours before check-in",
-                "rating": 4.0 + (i * 0.3) + random.uniform(0, 0.2),
-                "reviews_count": 100 + (i * 100) + random.randint(0, 50)
-            }
-            hotels.append(hotel)
-        
-        return hotels
+        # Fresh dicts (and amenity lists) so callers can't modify the cached options
+        return [
+            {**hotel, "amenities": list(hotel["amenities"])}
+            for hotel in _enhanced_hotel_mock_options(city, check_in, check_out)
+        ]
     
     def _get_fallback_flight_data(self, origin: str, destination: str, 
                                  departure_date: str, return_date: str = None) -> Dict:
         """Fallback flight data when AI generation fails"""
-        return {
-            "search_id": f"search_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "origin": origin,
-            "destination": destination,
-            "departure_date": departure_date,
-            "return_date": return_date,
-            "flights": self._generate_enhanced_flight_mock_data(origin, destination, departure_date, return_date),
-            "total_results": 3,
-            "search_timestamp": datetime.now().isoformat()
-        }
+        return self._flight_search_result(
+            origin, destination, departure_date, return_date,
+            self._generate_enhanced_flight_mock_data(origin, destination, departure_date, return_date)
+        )
     
     def _get_fallback_hotel_data(self, city: str, check_in: str, check_out: str) -> Dict:
         """Fallback hotel data when AI generation fails"""
-        return {
-            "search_id": f"hotel_search_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "city": city,
-            "check_in": check_in,
-            "check_out": check_out,
-            "hotels": self._generate_enhanced_hotel_mock_data(city, check_in, check_out),
-            "total_results": 3,
-            "search_timestamp": datetime.now().isoformat()
-        }
+        return self._hotel_search_result(
+            city, check_in, check_out,
+            self._generate_enhanced_hotel_mock_data(city, check_in, check_out)
+        )
 
 # Global instance
 ai_booking_generator = AIBookingDataGenerator()
@@ -1,21 +1,48 @@
 import streamlit as st
-import re,time
+import re,time,hashlib
 from cloudsql_database_config import get_database
 db = get_database()
-from google_auth import show_google_signin_button, handle_google_callback
+
+# Validation patterns, compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+
+class _AuthenticationFailed(Exception):
+    """Raised inside the cached login so failures are never cached"""
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_authenticate(username, password_digest, _password):
+    """Authenticate once per (username, password digest) within a short window.
+
+    Streamlit can resubmit the login form on a stuttered click; the digest keys the
+    cache so the raw password never becomes part of the key. Only successful logins
+    are cached, and without the password hash.
+    """
+    user = db.authenticate_user(username, _password)
+    if user is None:
+        # Bad credentials and transient DB errors both raise, so a retry hits the database again
+        raise _AuthenticationFailed()
+    user.pop('password_hash', None)
+    return user
 
 def validate_email(email):
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 def validate_password(password):
     """Validate password strength"""
     if len(password) < 6:
         return False, "Password must be at least 6 characters long"
-    if not re.search(r'[A-Za-z]', password):
+    # Single pass with early exit; ASCII letters and decimal digits match [A-Za-z] and \d
+    has_alpha = has_digit = False
+    for c in password:
+        has_alpha |= c.isascii() and c.isalpha()
+        has_digit |= c.isdecimal()
+        if has_alpha and has_digit:
+            break
+    if not has_alpha:
         return False, "Password must contain at least one letter"
-    if not re.search(r'\d', password):
+    if not has_digit:
         return False, "Password must contain at least one number"
     return True, ""
 
@@ -23,7 +50,7 @@ def validate_username(username):
     """Validate username format"""
     if len(username) < 3:
         return False, "Username must be at least 3 characters long"
-    if not re.match(r'^[a-zA-Z0-9_]+$', username):
+    if not _USERNAME_RE.match(username):
         return False, "Username can only contain letters, numbers, and underscores"
     return True, ""
 
@@ -31,6 +58,7 @@ def validate_username(username):
 
 def login_page():
     """Display login page with enhanced UI and Google OAuth"""
+    from google_auth import show_google_signin_button, handle_google_callback
     # Handle Google OAuth callback
     if handle_google_callback():
         return
@@ -57,7 +85,11 @@ def login_page():
             
             with st.spinner("Authenticating..."):
                 time.sleep(1)  # Simulate API call
-                user = db.authenticate_user(username, password)
+                password_digest = hashlib.sha256(password.encode('utf-8')).hexdigest()
+                try:
+                    user = _cached_authenticate(username, password_digest, password)
+                except _AuthenticationFailed:
+                    user = None
                 if user:
                     st.session_state.user = user
                     st.session_state.logged_in = True
@@ -82,6 +114,7 @@ def login_page():
 def signup_page():
     """Display signup page with enhanced validation and Google OAuth"""
     """Display signup form"""
+    from google_auth import show_google_signin_button, handle_google_callback
     if handle_google_callback():
         return
     
@@ -139,17 +172,7 @@ def signup_page():
                 time.sleep(1)  # Simulate API call
                 success, message = db.create_user(username, email, password)
                 if success:
-                # Initialize user credits
-                    try:
-                        user = db.get_user_by_email(email)
-                        if user and 'id' in user:
-                            db.initialize_user_credits(user['id'])
-                        else:
-                            st.info("Unable to add user credits")
-                    except Exception as e:
-                        st.info(f"Unable to add user credits: {str(e)}")
-
-
+                    # Welcome credits are granted by create_user in the same transaction
                     st.success("Account created successfully! Please login.")
                     time.sleep(2)
                     st.session_state.show_login = True
@@ -172,11 +195,12 @@ def signup_page():
         st.rerun()
     
 
+_LOGOUT_KEYS = ('user', 'logged_in', 'current_trip', 'trip_id', 'login_method', 'oauth_state')
+
 def logout():
     """Logout user and clear session"""
-    for key in ['user', 'logged_in', 'current_trip', 'trip_id', 'login_method', 'oauth_state']:
-        if key in st.session_state:
-            del st.session_state[key]
+    for key in _LOGOUT_KEYS:
+        st.session_state.pop(key, None)
     st.rerun()
 
 
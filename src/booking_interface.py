@@ -170,17 +170,23 @@ class BookingInterface:
                     with col1:
                         # Add selection indicator
                         selection_indicator = "✅ " if is_selected else ""
-                        st.write(f"{selection_indicator}**{flight['airline']}** {flight['flight_number']}")
-                        st.write(f"🛫 {flight['departure_time']} → 🛬 {flight['arrival_time']}")
-                        st.write(f"⏱️ {flight['duration']} • {flight['stops']}")
+                        st.markdown(
+                            f"{selection_indicator}**{flight['airline']}** {flight['flight_number']}\n\n"
+                            f"🛫 {flight['departure_time']} → 🛬 {flight['arrival_time']}\n\n"
+                            f"⏱️ {flight['duration']} • {flight['stops']}"
+                        )
                     
                     with col2:
-                        st.write(f"**Aircraft:** {flight['aircraft']}")
-                        st.write(f"**Seats:** {flight['available_seats']} available")
+                        st.markdown(
+                            f"**Aircraft:** {flight['aircraft']}\n\n"
+                            f"**Seats:** {flight['available_seats']} available"
+                        )
                     
                     with col3:
-                        st.write(f"**Price:** ₹{flight['price']:,}")
-                        st.write(f"**Class:** {flight['class_type']}")
+                        st.markdown(
+                            f"**Price:** ₹{flight['price']:,}\n\n"
+                            f"**Class:** {flight['class_type']}"
+                        )
                     
                     with col4:
                         
@@ -212,19 +218,25 @@ class BookingInterface:
                     with col1:
                         # Add selection indicator
                         selection_indicator = "✅ " if is_selected else ""
-                        st.write(f"{selection_indicator}**{hotel['name']}** ⭐{hotel['star_rating']}")
-                        st.write(f"📍 {hotel['address']}")
-                        st.write(f"🏷️ {hotel['room_type']}")
+                        st.markdown(
+                            f"{selection_indicator}**{hotel['name']}** ⭐{hotel['star_rating']}\n\n"
+                            f"📍 {hotel['address']}\n\n"
+                            f"🏷️ {hotel['room_type']}"
+                        )
                     
                     with col2:
                         amenities = ", ".join(hotel['amenities'][:3])
-                        st.write(f"**Amenities:** {amenities}")
-                        st.write(f"**Rating:** {hotel['rating']}/5 ({hotel['reviews_count']} reviews)")
+                        st.markdown(
+                            f"**Amenities:** {amenities}\n\n"
+                            f"**Rating:** {hotel['rating']}/5 ({hotel['reviews_count']} reviews)"
+                        )
                     
                     with col3:
-                        st.write(f"**Price:** ₹{hotel['total_price']:,} total")
-                        st.write(f"**Per night:** ₹{hotel['price_per_night']:,}")
-                        st.write(f"**Rooms:** {hotel['available_rooms']} available")
+                        st.markdown(
+                            f"**Price:** ₹{hotel['total_price']:,} total\n\n"
+                            f"**Per night:** ₹{hotel['price_per_night']:,}\n\n"
+                            f"**Rooms:** {hotel['available_rooms']} available"
+                        )
                     
                     with col4:
                         
@@ -1,13 +1,14 @@
 import streamlit as st
 import json
 from datetime import datetime
-from vertex_ai_utils import VertexAITripPlanner
+from vertex_ai_utils import trip_planner
 from cloudsql_database_config import get_database
 db = get_database()
 
 class ChatInterface:
     def __init__(self):
-        self.vertex_ai = VertexAITripPlanner()
+        # Share the module-level planner so reruns reuse its Vertex AI client
+        self.vertex_ai = trip_planner
     
     def show_chat_interface(self, trip_id, user_id, current_trip_data):
         """Display the interactive chat interface for trip refinement"""
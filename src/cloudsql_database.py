@@ -1,31 +1,181 @@
 from google.cloud.sql.connector import Connector
 import sqlalchemy
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
 import bcrypt
 import streamlit as st
 from datetime import datetime
 import os
-from contextlib import contextmanager
+from functools import lru_cache
 import json
+import time
 from datetime import datetime, date
 
+try:
+    # orjson encodes/parses the stored trip JSON several times faster; stdlib json is the fallback
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        # orjson writes dates natively; decode because MySQL rejects binary strings for JSON columns
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, default=_json_default)
+
+
+def _json_default(obj):
+    """Serialize datetime/date values that json can't encode on its own"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# Secondary indexes for the hot lookups: (table, index name, columns)
+_INDEXES = (
+    ("users", "idx_users_email_active", "email, is_active"),
+    ("users", "idx_users_username_active", "username, is_active"),
+    ("trips", "idx_trips_user_created", "user_id, created_at DESC"),
+    ("trips", "idx_trips_user_dest", "user_id, destination"),
+    ("credit_transactions", "idx_credit_tx_user_created", "user_id, created_at DESC"),
+)
+# MySQL ER_DUP_KEYNAME: another instance created the index between our check and CREATE INDEX
+_ER_DUP_KEYNAME = 1061
+
+# Hot statements are built once at import; SQLAlchemy caches the compiled form per text() object
+_SCHEMA_PROBE_SQL = sqlalchemy.text("SELECT 1 FROM credit_transactions LIMIT 0")
+
+# Public user columns (no password hash) and one lookup statement per key column, all from one template
+_USER_COLS = "id, username, email, name, google_id, picture, verified_email, created_at, last_login, is_active, login_method"
+_USER_BY_SQL = {
+    column: sqlalchemy.text(f"SELECT {_USER_COLS} FROM users WHERE {column} = :value AND is_active = 1")
+    for column in ("id", "email")
+}
+_AUTH_BY_EMAIL_SQL = sqlalchemy.text("SELECT * FROM users WHERE email=:input AND is_active=1")
+_AUTH_BY_USERNAME_SQL = sqlalchemy.text("SELECT * FROM users WHERE username=:input AND is_active=1")
+_UPDATE_LAST_LOGIN_SQL = sqlalchemy.text("UPDATE users SET last_login=CURRENT_TIMESTAMP WHERE id=:id")
+_INSERT_CREDIT_TX_SQL = sqlalchemy.text("""
+    INSERT INTO credit_transactions (user_id, trip_id, transaction_type, credits_amount, description)
+    VALUES (:user_id, :trip_id, :transaction_type, :credits_amount, :description)
+""")
+_USER_CREDITS_SQL = sqlalchemy.text("""
+    SELECT t.total_credits,
+           t.total_used,
+           t.total_credits - t.total_used AS credits_remaining,
+           t.total_trips
+    FROM (
+        SELECT
+            (SELECT COALESCE(SUM(credits_amount), 0)
+             FROM credit_transactions
+             WHERE user_id = :uid
+             AND transaction_type IN ('welcome_bonus', 'purchase', 'refund')) AS total_credits,
+            COALESCE(SUM(credits_used), 0) AS total_used,
+            COUNT(*) AS total_trips
+        FROM trips
+        WHERE user_id = :uid
+    ) AS t
+""")
+# Google sign-in upsert: inserts a new user or links/refreshes the existing row on a duplicate email/google_id
+_UPSERT_GOOGLE_USER_SQL = sqlalchemy.text("""
+    INSERT INTO users (username, email, name, google_id, picture, verified_email, login_method, last_login)
+    VALUES (:username, :email, :name, :google_id, :picture, :verified_email, 'google', CURRENT_TIMESTAMP)
+    ON DUPLICATE KEY UPDATE
+        id = LAST_INSERT_ID(id),
+        google_id = VALUES(google_id),
+        picture = VALUES(picture),
+        verified_email = VALUES(verified_email),
+        login_method = 'google',
+        last_login = CURRENT_TIMESTAMP
+""")
+# Welcome credits that are only granted if the user has none yet
+_INSERT_WELCOME_BONUS_ONCE_SQL = sqlalchemy.text("""
+    INSERT INTO credit_transactions (user_id, trip_id, transaction_type, credits_amount, description)
+    SELECT :user_id, NULL, :transaction_type, :credits_amount, :description FROM DUAL
+    WHERE NOT EXISTS (
+        SELECT 1 FROM credit_transactions WHERE user_id = :user_id AND transaction_type = :transaction_type
+    )
+""")
+_CREDIT_TRANSACTIONS_SQL = sqlalchemy.text("""
+    SELECT ct.id, ct.user_id, ct.trip_id, ct.transaction_type, ct.credits_amount,
+           ct.description, ct.created_at, t.destination
+    FROM credit_transactions ct
+    LEFT JOIN trips t ON t.id = ct.trip_id
+    WHERE ct.user_id = :uid
+    ORDER BY ct.created_at DESC
+    LIMIT :limit
+""")
+_USER_STATS_SQL = sqlalchemy.text("""
+    SELECT COUNT(*) AS trip_count,
+           COALESCE(SUM(budget), 0) AS total_budget,
+           (SELECT destination
+            FROM trips
+            WHERE user_id = :uid
+            GROUP BY destination
+            ORDER BY COUNT(*) DESC
+            LIMIT 1) AS popular_destination
+    FROM trips
+    WHERE user_id = :uid
+""")
+# JSON payloads are bound as utf-8 text and cast server-side straight into the JSON columns
+_INSERT_TRIP_SQL = sqlalchemy.text("""
+    INSERT INTO trips
+    (user_id, destination, current_city, start_date, end_date, budget, preferences, itinerary_preference, ai_suggestions, currency, currency_symbol)
+    VALUES
+    (:user_id, :destination, :current_city, :start_date, :end_date, :budget, CAST(:preferences AS JSON), :itinerary_preference, CAST(:ai_suggestions AS JSON), :currency, :currency_symbol)
+""")
+_USER_TRIPS_SQL = sqlalchemy.text("SELECT * FROM trips WHERE user_id = :uid")
+
+# Trip columns stored as serialized JSON
+_TRIP_JSON_FIELDS = ("preferences", "ai_suggestions")
+
+# Trip columns update_trip may write; anything else in kwargs is ignored
+_ALLOWED_TRIP_FIELDS = frozenset({
+    'destination', 'current_city', 'start_date', 'end_date', 'budget', 'currency', 'currency_symbol',
+    'preferences', 'itinerary_preference', 'ai_suggestions', 'status', 'booking_status', 'booking_id',
+    'booking_confirmation', 'credits_used'
+})
+
+@lru_cache(maxsize=64)
+def _build_trip_update_sql(fields):
+    """UPDATE statement for a sorted tuple of trip columns, built once per field combination"""
+    assignments = ", ".join(f"{field} = :{field}" for field in fields)
+    return sqlalchemy.text(f"UPDATE trips SET {assignments} WHERE id = :trip_id AND user_id = :user_id")
+
+# (transaction_type, credits_amount, description) granted to every new account
+WELCOME_BONUS = ("welcome_bonus", 1000, "Welcome bonus 1000 credits")
+
 class MySQLDatabaseManager:
+    # Set after the first successful init_database so later instances skip the schema checks
+    _schema_ready = False
+
     def __init__(self):
         # DB settings from env vars (Cloud Run / Secret Manager)
         self.connection_name = os.getenv("CLOUDSQL_CONNECTION_NAME")  # e.g., project:region:instance
         self.database = os.getenv("MYSQL_DATABASE", "trip_planner")
         self.user = os.getenv("MYSQL_USER", "root")
         self.password = os.getenv("MYSQL_PASSWORD", "")
+        self.bcrypt_cost = int(os.getenv("BCRYPT_COST", "10"))
         self.connector = Connector()
 
+        # Pool sizing: connections are reused across calls instead of re-handshaking
+        self.pool_size = int(os.getenv("MYSQL_POOL_SIZE", 4 * (os.cpu_count() or 1)))
+        self.max_overflow = int(os.getenv("MYSQL_POOL_MAX_OVERFLOW", self.pool_size))
+
         # SQLAlchemy engine using Cloud SQL Python Connector
         self.engine = sqlalchemy.create_engine(
             "mysql+pymysql://",
             creator=self.getconn,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
             pool_recycle=300,
             pool_pre_ping=True
         )
 
+        # Short-lived per-user credit summaries: {user_id: (expires_at, credits)}
+        self.credits_cache_ttl = int(os.getenv("CREDITS_CACHE_TTL", "30"))
+        self._credits_cache = {}
+
         self.init_database()
 
     def getconn(self):
@@ -38,75 +188,106 @@ class MySQLDatabaseManager:
             db=self.database
         )
 
-    @contextmanager
+    # Both return SQLAlchemy's own context managers directly, no extra generator frame per query
     def get_connection(self):
-        """Context manager for SQLAlchemy connection"""
-        with self.engine.connect() as conn:
-            yield conn
+        """Context manager for a pooled SQLAlchemy connection (returned to the pool on exit)"""
+        return self.engine.connect()
+
+    def write_transaction(self):
+        """Context manager for a pooled connection in one transaction: commits once on exit, rolls back on error"""
+        return self.engine.begin()
 
     def init_database(self):
-        """Initialize tables"""
+        """Initialize tables (once per process)"""
+        if MySQLDatabaseManager._schema_ready:
+            return
         try:
             with self.get_connection() as conn:
-                conn.execute(sqlalchemy.text('''
-                    CREATE TABLE IF NOT EXISTS users (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        username VARCHAR(255) UNIQUE NOT NULL,
-                        email VARCHAR(255) UNIQUE NOT NULL,
-                        password_hash TEXT,
-                        name VARCHAR(255),
-                        google_id VARCHAR(255) UNIQUE,
-                        picture TEXT,
-                        verified_email BOOLEAN DEFAULT FALSE,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        last_login TIMESTAMP NULL,
-                        is_active BOOLEAN DEFAULT TRUE,
-                        login_method VARCHAR(50) DEFAULT 'email'
-                    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                '''))
-                conn.execute(sqlalchemy.text('''
-                    CREATE TABLE IF NOT EXISTS trips (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        user_id INT NOT NULL,
-                        destination VARCHAR(255) NOT NULL,
-                        start_date DATE,
-                        end_date DATE,
-                        budget DECIMAL(10,2),
-                        currency VARCHAR(10),
-                        currency_symbol VARCHAR(5) DEFAULT '$',
-                        preferences JSON,
-                        ai_suggestions JSON,
-                        status VARCHAR(50) DEFAULT 'planned',
-                        booking_status VARCHAR(50) DEFAULT 'not_booked',
-                        booking_id VARCHAR(255),
-                        booking_confirmation TEXT,
-                        credits_used INT DEFAULT 0,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-                    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                '''))
-                conn.execute(sqlalchemy.text('''
-                    CREATE TABLE IF NOT EXISTS credit_transactions (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        user_id INT NOT NULL,
-                        trip_id INT,
-                        transaction_type VARCHAR(100) NOT NULL,
-                        credits_amount INT NOT NULL,
-                        description TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-                        FOREIGN KEY (trip_id) REFERENCES trips(id) ON DELETE SET NULL
-                    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                '''))
+                # Skip the CREATE TABLE round trips when the schema is already there
+                if not self._schema_exists(conn):
+                    conn.execute(sqlalchemy.text('''
+                        CREATE TABLE IF NOT EXISTS users (
+                            id INT AUTO_INCREMENT PRIMARY KEY,
+                            username VARCHAR(255) UNIQUE NOT NULL,
+                            email VARCHAR(255) UNIQUE NOT NULL,
+                            password_hash TEXT,
+                            name VARCHAR(255),
+                            google_id VARCHAR(255) UNIQUE,
+                            picture TEXT,
+                            verified_email BOOLEAN DEFAULT FALSE,
+                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                            last_login TIMESTAMP NULL,
+                            is_active BOOLEAN DEFAULT TRUE,
+                            login_method VARCHAR(50) DEFAULT 'email'
+                        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+                    '''))
+                    conn.execute(sqlalchemy.text('''
+                        CREATE TABLE IF NOT EXISTS trips (
+                            id INT AUTO_INCREMENT PRIMARY KEY,
+                            user_id INT NOT NULL,
+                            destination VARCHAR(255) NOT NULL,
+                            start_date DATE,
+                            end_date DATE,
+                            budget DECIMAL(10,2),
+                            currency VARCHAR(10),
+                            currency_symbol VARCHAR(5) DEFAULT '$',
+                            preferences JSON,
+                            ai_suggestions JSON,
+                            status VARCHAR(50) DEFAULT 'planned',
+                            booking_status VARCHAR(50) DEFAULT 'not_booked',
+                            booking_id VARCHAR(255),
+                            booking_confirmation TEXT,
+                            credits_used INT DEFAULT 0,
+                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+                        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+                    '''))
+                    conn.execute(sqlalchemy.text('''
+                        CREATE TABLE IF NOT EXISTS credit_transactions (
+                            id INT AUTO_INCREMENT PRIMARY KEY,
+                            user_id INT NOT NULL,
+                            trip_id INT,
+                            transaction_type VARCHAR(100) NOT NULL,
+                            credits_amount INT NOT NULL,
+                            description TEXT,
+                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+                            FOREIGN KEY (trip_id) REFERENCES trips(id) ON DELETE SET NULL
+                        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+                    '''))
+                self._ensure_indexes(conn)
                 conn.commit()
+            MySQLDatabaseManager._schema_ready = True
         except Exception as e:
             st.error(f"Error initializing database: {str(e)}")
             raise
+
+    def _schema_exists(self, conn):
+        """Cheap probe: the last table init_database creates is queryable"""
+        try:
+            conn.execute(_SCHEMA_PROBE_SQL)
+            return True
+        except ProgrammingError:
+            return False
+
+    def _ensure_indexes(self, conn):
+        """Create any missing secondary indexes (MySQL has no CREATE INDEX IF NOT EXISTS)"""
+        existing = set(conn.execute(sqlalchemy.text("""
+            SELECT DISTINCT index_name FROM information_schema.statistics
+            WHERE table_schema = DATABASE()
+        """)).scalars())
+        for table, name, columns in _INDEXES:
+            if name not in existing:
+                try:
+                    conn.execute(sqlalchemy.text(f"CREATE INDEX {name} ON {table} ({columns})"))
+                except OperationalError as e:
+                    if e.orig.args[0] != _ER_DUP_KEYNAME:
+                        raise
     
-    # Hash password for signup
+    # Hash password for signup (cost tunable per deployment via BCRYPT_COST)
     def hash_password(self, password: str) -> str:
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(self.bcrypt_cost)).decode('utf-8')
         
     # Verify password on login
     def verify_password(self, password: str, hashed: str) -> bool:
@@ -118,13 +299,13 @@ class MySQLDatabaseManager:
     def authenticate_user(self, username_or_email: str, password: str):
         """Authenticate user by username/email + raw password (temporary, no hashing)"""
         try:
-            query = "SELECT * FROM users WHERE email=:input AND is_active=1" if "@" in username_or_email \
-                    else "SELECT * FROM users WHERE username=:input AND is_active=1"
+            query = _AUTH_BY_EMAIL_SQL if "@" in username_or_email else _AUTH_BY_USERNAME_SQL
 
-            with self.get_connection() as conn:
-                user = conn.execute(sqlalchemy.text(query), {"input": username_or_email}).mappings().first()
+            # Stamp last_login on the same connection instead of opening a second one
+            with self.write_transaction() as conn:
+                user = conn.execute(query, {"input": username_or_email}).mappings().first()
                 if user and user['password_hash'] == password:  # compare raw password
-                    self.update_last_login(user['id'])
+                    conn.execute(_UPDATE_LAST_LOGIN_SQL, {"id": user['id']})
                     return dict(user)
             return None
         except Exception as e:
@@ -133,20 +314,13 @@ class MySQLDatabaseManager:
 
 
 
-    def update_last_login(self, user_id):
-        try:
-            with self.get_connection() as conn:
-                conn.execute(sqlalchemy.text("UPDATE users SET last_login=CURRENT_TIMESTAMP WHERE id=:id"), {"id": user_id})
-        except Exception as e:
-            st.error(f"Error updating last login: {str(e)}")
-
     def create_user(self, username, email, password_hash, name=None, login_method="email"):
         try:
             #password_hash=self.hash_password(password_hash)
             if password_hash:
                 st.info(f"Password Hashed:{password_hash}")
-            with self.get_connection() as conn:
-                conn.execute(sqlalchemy.text("""
+            with self.write_transaction() as conn:
+                result = conn.execute(sqlalchemy.text("""
                     INSERT INTO users (username, email, password_hash, name, login_method)
                     VALUES (:username, :email, :password_hash, :name, :login_method)
                 """), {
@@ -156,13 +330,9 @@ class MySQLDatabaseManager:
                     "name": name,
                     "login_method": login_method
                 })
-                conn.commit()
 
-                # Get the newly created user ID
-                user_id = conn.execute(
-                    sqlalchemy.text("SELECT id FROM users WHERE email=:email"),
-                    {"email": email}
-                ).scalar()
+                # Welcome bonus goes in the same transaction, so signup is a single commit
+                self._insert_credit_transaction(conn, result.lastrowid, None, *WELCOME_BONUS)
 
             return True, "✅ User created successfully"
 
@@ -172,12 +342,47 @@ class MySQLDatabaseManager:
         except Exception as e:
             return False, f"❌ Error creating user: {str(e)}"
 
+    def create_google_user(self, username, email, name, google_id, picture=None, verified_email=False):
+        """Insert a Google user, or link/refresh the existing account with the same email, in one statement"""
+        try:
+            with self.write_transaction() as conn:
+                result = conn.execute(_UPSERT_GOOGLE_USER_SQL, {
+                    "username": username,
+                    "email": email,
+                    "name": name,
+                    "google_id": google_id,
+                    "picture": picture,
+                    "verified_email": bool(verified_email)
+                })
+                # rowcount is 1 for a fresh insert (2 when an existing row was updated)
+                if result.rowcount == 1:
+                    transaction_type, credits_amount, description = WELCOME_BONUS
+                    conn.execute(_INSERT_WELCOME_BONUS_ONCE_SQL, {
+                        "user_id": result.lastrowid,
+                        "transaction_type": transaction_type,
+                        "credits_amount": credits_amount,
+                        "description": description
+                    })
+            return True, "Google user saved successfully"
+        except Exception as e:
+            st.error(f"Error saving Google user: {str(e)}")
+            return False, f"Error saving Google user: {str(e)}"
+
+    def _fetch_user(self, column, value):
+        """Fetch one active user by a key column ("id" or "email") as a dict"""
+        try:
+            with self.get_connection() as conn:
+                user = conn.execute(_USER_BY_SQL[column], {"value": value}).mappings().first()
+            return dict(user) if user else None
+        except Exception as e:
+            st.error(f"Error fetching user: {str(e)}")
+            return None
+
+    def get_user_by_id(self, user_id):
+        return self._fetch_user("id", user_id)
+
     def get_user_by_email(self, email: str):
-        cursor = self.conn.cursor(dictionary=True)
-        cursor.execute("SELECT * FROM users WHERE email = %s", (email,))
-        result = cursor.fetchone()
-        cursor.close()
-        return result
+        return self._fetch_user("email", email)
 
     # ---------------- Trips ---------------- #
     def create_trip(
@@ -196,16 +401,11 @@ class MySQLDatabaseManager:
     ):
         """Create a new trip in Cloud SQL"""
         try:
-            preferences_json = json.dumps(preferences) if preferences else None
-            ai_suggestions_json = json.dumps(ai_suggestions) if ai_suggestions else None
+            preferences_json = _json_dumps(preferences) if preferences else None
+            ai_suggestions_json = _json_dumps(ai_suggestions) if ai_suggestions else None
 
-            with self.get_connection() as conn:
-                conn.execute(sqlalchemy.text("""
-                    INSERT INTO trips
-                    (user_id, destination, current_city, start_date, end_date, budget, preferences, itinerary_preference, ai_suggestions, currency, currency_symbol)
-                    VALUES
-                    (:user_id, :destination, :current_city, :start_date, :end_date, :budget, :preferences, :itinerary_preference, :ai_suggestions, :currency, :currency_symbol)
-                """), {
+            with self.write_transaction() as conn:
+                conn.execute(_INSERT_TRIP_SQL, {
                     "user_id": user_id,
                     "destination": destination,
                     "current_city": current_city,
@@ -219,6 +419,7 @@ class MySQLDatabaseManager:
                     "currency_symbol": currency_symbol
                 })
 
+            self._invalidate_user_credits(user_id)
             return True, "Trip created successfully"
 
         except Exception as e:
@@ -227,76 +428,64 @@ class MySQLDatabaseManager:
 
 
     # ---------------- Credits ---------------- #
-    def initialize_user_credits(self, user_id):
-        self.add_credit_transaction(
-            user_id=user_id,
-            trip_id=None,
-            transaction_type="welcome_bonus",
-            credits_amount=1000,
-            description="Welcome bonus 1000 credits"
-        )
-
+    def _insert_credit_transaction(self, conn, user_id, trip_id, transaction_type, credits_amount, description):
+        """Insert a credit transaction on an already-open connection (caller commits)"""
+        conn.execute(_INSERT_CREDIT_TX_SQL, {
+            "user_id": user_id,
+            "trip_id": trip_id,
+            "transaction_type": transaction_type,
+            "credits_amount": credits_amount,
+            "description": description
+        })
 
     def add_credit_transaction(self, user_id, trip_id, transaction_type, credits_amount, description):
         try:
-            query = """
-                INSERT INTO credit_transactions (user_id, trip_id, transaction_type, credits_amount, description)
-                VALUES (:user_id, :trip_id, :transaction_type, :credits_amount, :description)
-            """
-            with self.get_connection() as conn:
-                conn.execute(sqlalchemy.text(query), {
-                    "user_id": user_id,
-                    "trip_id": trip_id,
-                    "transaction_type": transaction_type,
-                    "credits_amount": credits_amount,
-                    "description": description
-                })
+            with self.write_transaction() as conn:
+                self._insert_credit_transaction(conn, user_id, trip_id, transaction_type, credits_amount, description)
+            self._invalidate_user_credits(user_id)
         except Exception as e:
             st.error(f"Error adding credit transaction: {str(e)}")
 
+    def _invalidate_user_credits(self, user_id):
+        """Drop the cached credit summary after a write that changes it"""
+        self._credits_cache.pop(user_id, None)
+
+    def get_credit_transactions(self, user_id, limit=50):
+        """Most recent credit transactions for a user, newest first, with the trip destination"""
+        try:
+            with self.get_connection() as conn:
+                # Rows come back already typed by the driver; no per-field casting needed
+                rows = conn.execute(_CREDIT_TRANSACTIONS_SQL, {"uid": user_id, "limit": int(limit)}).mappings().all()
+            return [dict(row) for row in rows]
+        except Exception as e:
+            st.error(f"Error getting credit transactions: {str(e)}")
+            return []
+
     def get_user_credits(self, user_id):
         """Get user's credit information safely"""
+        # Reruns ask for the same summary several times per page; serve it from cache while fresh
+        cached = self._credits_cache.get(user_id)
+        if cached and cached[0] > time.monotonic():
+            return dict(cached[1])
+
         try:
             with self.get_connection() as conn:
-                # Get total credits used in trips
-                credits_used_result = conn.execute(
-                    sqlalchemy.text("""
-                        SELECT COALESCE(SUM(credits_used), 0) AS total_used, COUNT(*) AS total_trips
-                        FROM trips
-                        WHERE user_id = :uid
-                    """),
-                    {"uid": user_id}
-                )
-                row = credits_used_result.fetchone()
-                total_used = int(row[0]) if row and row[0] is not None else 0
-                total_trips = int(row[1]) if row and row[1] is not None else 0
-
-                # Get total credits from credit transactions
-                total_credits_result = conn.execute(
-                    sqlalchemy.text("""
-                        SELECT COALESCE(SUM(credits_amount), 0) AS total_credits
-                        FROM credit_transactions
-                        WHERE user_id = :uid
-                        AND transaction_type IN ('welcome_bonus', 'purchase', 'refund')
-                    """),
-                    {"uid": user_id}
-                )
-                total_credits_row = total_credits_result.fetchone()
-                total_credits = int(total_credits_row[0]) if total_credits_row and total_credits_row[0] is not None else 1000
-
+                # One round trip: trip usage and credit grants aggregated server-side
+                row = conn.execute(_USER_CREDITS_SQL, {"uid": user_id}).fetchone()
+                total_credits, total_used, credits_remaining, total_trips = (int(value) for value in row)
 
                 # Avoid division by zero
-                
                 avg_credits_per_trip = total_used / total_trips if total_trips else 0
 
-
-                return {
+                credits = {
                     'total_credits': total_credits,
                     'credits_used': total_used,
-                    'credits_remaining': total_credits - total_used,
+                    'credits_remaining': credits_remaining,
                     'total_trips': total_trips,
                     'avg_credits_per_trip': avg_credits_per_trip
                 }
+                self._credits_cache[user_id] = (time.monotonic() + self.credits_cache_ttl, credits)
+                return dict(credits)
 
         except Exception as e:
             st.error(f"Error getting user credits: {str(e)}")
@@ -313,40 +502,16 @@ class MySQLDatabaseManager:
         """Get user statistics"""
         try:
             with self.get_connection() as conn:
-                # Get trip count
-                trip_count_result = conn.execute(
-                    sqlalchemy.text("SELECT COUNT(*) FROM trips WHERE user_id = :uid"),
-                    {"uid": user_id}
-                )
-                trip_count = trip_count_result.scalar() or 0
-
-                # Get total budget
-                total_budget_result = conn.execute(
-                    sqlalchemy.text("SELECT SUM(budget) FROM trips WHERE user_id = :uid"),
-                    {"uid": user_id}
-                )
-                total_budget = float(total_budget_result.scalar() or 0)
-
-                # Get most popular destination
-                popular_dest_result = conn.execute(
-                    sqlalchemy.text("""
-                        SELECT destination, COUNT(*) as count
-                        FROM trips
-                        WHERE user_id = :uid
-                        GROUP BY destination
-                        ORDER BY count DESC
-                        LIMIT 1
-                    """),
-                    {"uid": user_id}
-                )
-                popular_destination_row = popular_dest_result.fetchone()
-                popular_dest = popular_destination_row[0] if popular_destination_row else "None"
-
-                return {
-                    'trip_count': trip_count,
-                    'total_budget': total_budget,
-                    'popular_destination': popular_dest
-                }
+                # Count, budget total and top destination in one round trip
+                trip_count, total_budget, popular_dest = conn.execute(
+                    _USER_STATS_SQL, {"uid": user_id}
+                ).fetchone()
+
+            return {
+                'trip_count': trip_count or 0,
+                'total_budget': float(total_budget or 0),
+                'popular_destination': popular_dest or "None"
+            }
 
         except Exception as e:
             st.error(f"Error getting user stats: {str(e)}")
@@ -356,71 +521,59 @@ class MySQLDatabaseManager:
                 'popular_destination': "None"
             }
         
-    def _make_json_serializable(self, obj):
-        """Convert datetime/date objects to JSON-safe strings"""
-        if isinstance(obj, dict):
-            return {key: self._make_json_serializable(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._make_json_serializable(item) for item in obj]
-        elif isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        else:
-            return obj
-
     def update_trip(self, trip_id, user_id, **kwargs):
         """
         Update trip record with flexible fields.
         Automatically makes JSON fields serializable.
         """
         try:
-            cursor = self.conn.cursor()
+            fields = tuple(sorted(key for key in kwargs if key in _ALLOWED_TRIP_FIELDS))
+            if not fields:
+                return False, "No valid fields to update"
 
-            fields = []
-            values = []
-
-            for key, value in kwargs.items():
+            values = {"trip_id": trip_id, "user_id": user_id}
+            for key in fields:
+                value = kwargs[key]
                 if key == "booking_confirmation" and value is not None:
-                    # Ensure JSON-serializable
-                    value = json.dumps(self._make_json_serializable(value))
-                fields.append(f"{key} = %s")
-                values.append(value)
-
-            values.extend([trip_id, user_id])
-
-            sql = f"""
-                UPDATE trips
-                SET {", ".join(fields)}
-                WHERE trip_id = %s AND user_id = %s
-            """
-            cursor.execute(sql, tuple(values))
-            self.conn.commit()
-            cursor.close()
-            return True
+                    # Dates are encoded during the dump, no separate conversion pass
+                    value = _json_dumps(value)
+                values[key] = value
+
+            # Same field set -> same cached statement, regardless of kwarg order
+            with self.write_transaction() as conn:
+                conn.execute(_build_trip_update_sql(fields), values)
+            if "credits_used" in values:
+                self._invalidate_user_credits(user_id)
+            return True, "Trip updated successfully"
         except Exception as e:
             print(f"❌ Error updating trip: {e}")
-            return False
-
+            return False, f"Error updating trip: {str(e)}"
+
+
+    def _deserialize_trip(self, row):
+        """Turn a trips row into a dict with its JSON fields decoded"""
+        trip = dict(row)
+        for field in _TRIP_JSON_FIELDS:
+            if trip.get(field):
+                try:
+                    trip[field] = _json_loads(trip[field])
+                except json.JSONDecodeError:
+                    pass
+        return trip
+
+    def iter_user_trips(self, user_id, batch_size=256):
+        """Yield a user's trips in batches instead of materializing the whole result set"""
+        with self.get_connection() as conn:
+            # stream_results uses an unbuffered cursor, so rows arrive as they are fetched
+            result = conn.execution_options(stream_results=True).execute(_USER_TRIPS_SQL, {"uid": user_id})
+            for rows in result.mappings().partitions(batch_size):
+                for row in rows:
+                    yield self._deserialize_trip(row)
 
     def get_user_trips(self, user_id):
         """Get all trips for a user with JSON fields deserialized"""
         try:
-            with self.get_connection() as conn:
-                result = conn.execute(
-                    sqlalchemy.text("SELECT * FROM trips WHERE user_id = :uid"),
-                    {"uid": user_id}
-                )
-                trips = []
-                for row in result.mappings().all():
-                    trip = dict(row)
-                    # Deserialize JSON fields if they exist
-                    for field in ["preferences", "ai_suggestions"]:
-                        if trip.get(field):
-                            try:
-                                trip[field] = json.loads(trip[field])
-                            except json.JSONDecodeError:
-                                pass
-                    trips.append(trip)
-            return trips
+            return list(self.iter_user_trips(user_id))
         except Exception as e:
             st.error(f"Error fetching trips: {str(e)}")
             return []
@@ -1,31 +1,68 @@
 import os
+from types import MappingProxyType
 import streamlit as st
 from dotenv import load_dotenv
 load_dotenv()
 
+# Env vars are read once at import; call reload_config() to pick up changes
+_ENV_KEYS = ("CLOUDSQL_CONNECTION_NAME", "POSTGRES_DB", "POSTGRES_USER", "MYSQL_PASSWORD")
+
+def _snapshot_env():
+    return MappingProxyType({key: os.environ.get(key) for key in _ENV_KEYS})
+
+_ENV_SNAPSHOT = _snapshot_env()
+
+def reload_config():
+    """Re-read env vars and secrets and drop the cached config"""
+    global _ENV_SNAPSHOT, _SECRETS_SOURCE
+    _ENV_SNAPSHOT = _snapshot_env()
+    _SECRETS_SOURCE = None
+    get_database_config.clear()
+    validate_mysql_config.clear()
+
+# Result of probing st.secrets; None until the first probe
+_MISSING = object()
+_SECRETS_SOURCE = None
+
+def _resolve_secrets():
+    """Probe st.secrets once and remember the Cloud SQL entries (or _MISSING)"""
+    global _SECRETS_SOURCE
+    if _SECRETS_SOURCE is None:
+        try:
+            if hasattr(st, 'secrets') and 'POSTGRES_USER' in st.secrets:
+                _SECRETS_SOURCE = {
+                    "connection_name": st.secrets["CLOUDSQL_CONNECTION_NAME"],
+                    "database": st.secrets["POSTGRES_DB"],
+                    "user": st.secrets["POSTGRES_USER"],
+                    "password": st.secrets["MYSQL_PASSWORD"],
+                }
+            else:
+                _SECRETS_SOURCE = _MISSING
+        except Exception:
+            _SECRETS_SOURCE = _MISSING
+    return _SECRETS_SOURCE
+
+@st.cache_resource
 def get_database_config():
-    """Get database configuration from Streamlit secrets (local) or env vars (Cloud Run)"""
+    """Get database configuration from Streamlit secrets (local) or env vars (Cloud Run)
+
+    Cached per process, so the read-only mapping is built once instead of on every rerun.
+    """
 
     # --- Local dev: use st.secrets.toml ---
-    try:
-        if hasattr(st, 'secrets') and 'POSTGRES_USER' in st.secrets:
-            return {
-                "connection_name": st.secrets["CLOUDSQL_CONNECTION_NAME"],
-                "database": st.secrets["POSTGRES_DB"],
-                "user": st.secrets["POSTGRES_USER"],
-                "password": st.secrets["MYSQL_PASSWORD"],
-            }
-    except Exception:
-        pass
+    secrets_config = _resolve_secrets()
+    if secrets_config is not _MISSING:
+        return MappingProxyType(secrets_config)
 
     # --- Cloud Run: fallback to env vars ---
-    return {
-        "connection_name": os.getenv("CLOUDSQL_CONNECTION_NAME", ""),
-        "database": os.getenv("POSTGRES_DB", "trip_planner"),
-        "user": os.getenv("POSTGRES_USER", "trip_planner"),
-        "password": os.getenv("MYSQL_PASSWORD", ""),
-    }
+    return MappingProxyType({
+        "connection_name": _ENV_SNAPSHOT["CLOUDSQL_CONNECTION_NAME"] or "",
+        "database": _ENV_SNAPSHOT["POSTGRES_DB"] or "trip_planner",
+        "user": _ENV_SNAPSHOT["POSTGRES_USER"] or "trip_planner",
+        "password": _ENV_SNAPSHOT["MYSQL_PASSWORD"] or "",
+    })
 
+@st.cache_resource
 def validate_mysql_config():
     """Validate that Cloud SQL config is complete"""
     config = get_database_config()
@@ -41,6 +78,7 @@ def validate_mysql_config():
 
     return True
 
+@st.cache_resource
 def get_database():
     """Factory function to get MySQLDatabaseManager instance"""
     validate_mysql_config()
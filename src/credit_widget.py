@@ -156,7 +156,7 @@ class CreditWidget:
                         st.write(transaction['transaction_type'].title())
                     
                     with col4:
-                        st.write(transaction['created_at'][:10])
+                        st.write(str(transaction['created_at'])[:10])
                     
                     st.divider()
             
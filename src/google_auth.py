@@ -1,10 +1,6 @@
 import streamlit as st
 import os
 import json
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
 import base64
 import hashlib
 import secrets
@@ -60,6 +56,9 @@ class GoogleAuth:
         """Get Google OAuth authorization URL"""
         if not self.is_configured:
             return None
+        
+        # Imported lazily: the OAuth client stack is only needed once OAuth is configured
+        from google_auth_oauthlib.flow import Flow
             
         flow = Flow.from_client_config(
             {
@@ -155,32 +154,7 @@ class GoogleAuth:
         name = google_user_info['name']
         google_id = google_user_info['id']
         
-        # Check if user already exists
-        existing_user = db.get_user_by_email(email)
-        if existing_user:
-            # If user exists, check if it's already a Google user
-            if existing_user.get('login_method') == 'google':
-                return existing_user
-            else:
-                # User exists but with different login method - link Google account
-                try:
-                    conn = db.get_connection()
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        UPDATE users 
-                        SET google_id = ?, picture = ?, verified_email = ?, login_method = 'google'
-                        WHERE email = ?
-                    """, (google_id, google_user_info.get('picture', ''), 
-                          google_user_info.get('verified_email', False), email))
-                    conn.commit()
-                    conn.close()
-                    
-                    return db.get_user_by_email(email)
-                except Exception as e:
-                    st.error("Authentication failed. Please try again.")
-                    return None
-        
-        # Create new user with Google info
+        # Upsert: creates the user, or links Google to an existing account with this email
         username = self._generate_username_from_email(email)
         success, message = db.create_google_user(
             username=username,
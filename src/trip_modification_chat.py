@@ -1,13 +1,15 @@
 import streamlit as st
 import json
+import traceback
 from datetime import datetime
-from vertex_ai_utils import VertexAITripPlanner
+from vertex_ai_utils import trip_planner
 from cloudsql_database_config import get_database
 db = get_database()
 
 class TripModificationChat:
     def __init__(self):
-        self.vertex_ai = VertexAITripPlanner()
+        # Share the module-level planner so reruns reuse its Vertex AI client
+        self.vertex_ai = trip_planner
     
     def show_modification_interface(self, trip_id, user_id, current_trip_data):
         """Display the interactive trip modification interface"""
@@ -356,8 +358,9 @@ class TripModificationChat:
                 
         except Exception as e:
             st.error(f"❌ Error applying modifications: {str(e)}")
-            import traceback
-            st.error(f"Debug info: {traceback.format_exc()}")
+            # Keep only the 5 frames nearest the raise site, so repeated failures don't format the full stack
+            debug_info = "".join(traceback.TracebackException.from_exception(e, limit=-5).format())
+            st.error(f"Debug info: {debug_info}")
     
     def _display_updated_trip_summary(self, updated_trip_data):
         """Display a summary of the updated trip"""
@@ -3,7 +3,7 @@ import json,logging,os
 from datetime import datetime, timedelta
 from cloudsql_database_config import get_database
 db = get_database()
-from vertex_ai_utils import VertexAITripPlanner
+from vertex_ai_utils import trip_planner
 from css_styles import inject_css, inject_compact_css, inject_app_header
 from credit_widget import credit_widget
 from widgets import with_dynamic_spinner, get_fun_spinner_messages,format_date_pretty,generate_and_display_pdf_options
@@ -28,8 +28,8 @@ logger = logging.getLogger(__name__)
 def get_suggestions(vertex_ai,destination,start_date,end_date,budget,preferences_str,selected_currency,currency_symbol):
     return vertex_ai.generate_trip_suggestions(
         destination=destination.strip(),
-        start_date=start_date.strftime("%Y-%m-%d"),
-        end_date=end_date.strftime("%Y-%m-%d"),
+        start_date=start_date,
+        end_date=end_date,
         budget=float(budget),
         preferences=preferences_str,
         currency=selected_currency,
@@ -110,14 +110,13 @@ from auth import  check_auth
 def logout():
     """Logout user and clear session state"""
     # Clear all session state variables
-    keys_to_clear = [
+    keys_to_clear = (
         'logged_in', 'user', 'current_trip', 'trip_id', 
         'active_profile_tab', 'trip_planner_page', 'form_data'
-    ]
+    )
     
     for key in keys_to_clear:
-        if key in st.session_state:
-            del st.session_state[key]
+        st.session_state.pop(key, None)
     
     # Clear any Google OAuth related session state
     google_keys = [key for key in st.session_state.keys() if key.startswith('google_')]
@@ -131,8 +130,7 @@ def logout():
 
 def show_dashboard():
     """Show modern user dashboard overview (sidebar handled by parent)"""
-    # Inject compact CSS only
-    inject_compact_css()
+    # Compact CSS is already injected by show_trip_planner for this run
     
     if 'user' not in st.session_state:
         st.error("❌ Please log in to view dashboard!")
@@ -431,8 +429,8 @@ def plan_new_trip():
         st.error("❌ Please log in to plan a trip!")
         return
     
-    # Initialize Vertex AI
-    vertex_ai = VertexAITripPlanner()
+    # Shared planner: reruns reuse its Vertex AI client instead of rebuilding it
+    vertex_ai = trip_planner
     
     # Check if we have a trip to display
     if 'current_trip' in st.session_state and st.session_state.current_trip:
@@ -682,12 +680,16 @@ def plan_new_trip():
             if additional_preferences and additional_preferences.strip():
                 preferences_str += f" | Additional: {additional_preferences.strip()}"
             
+            # Format the dates once; isoformat() yields the same YYYY-MM-DD as strftime
+            start_str = start_date.isoformat()
+            end_str = end_date.isoformat()
+            
             # Store form data in session state
             st.session_state.form_data = {
                 'destination': destination.strip(),
                 'current_city': current_city.strip(),
-                'start_date': start_date.strftime("%Y-%m-%d"),
-                'end_date': end_date.strftime("%Y-%m-%d"),
+                'start_date': start_str,
+                'end_date': end_str,
                 'budget': float(budget),
                 'currency': selected_currency,
                 'currency_symbol': currency_symbol,
@@ -699,8 +701,8 @@ def plan_new_trip():
             
             # Generate suggestions
             try:
-                suggestions = get_suggestions(vertex_ai,destination,start_date,
-                                              end_date,budget,preferences_str,selected_currency,currency_symbol)
+                suggestions = get_suggestions(vertex_ai,destination,start_str,
+                                              end_str,budget,preferences_str,selected_currency,currency_symbol)
                 
                 if not suggestions:
                     st.error("❌ Failed to generate trip suggestions. Please try again.")
@@ -718,11 +720,11 @@ def plan_new_trip():
                 success, message = db.create_trip(
                     st.session_state.user['id'],
                     destination.strip(),
-                    start_date.strftime("%Y-%m-%d"),
-                    end_date.strftime("%Y-%m-%d"),
+                    start_str,
+                    end_str,
                     float(budget),
                     preferences_str,
-                    json.dumps(suggestions),
+                    suggestions,  # encoded once by the DB layer
                     selected_currency,
                     currency_symbol,
                     current_city.strip(),
@@ -609,18 +609,19 @@ Provide a helpful, detailed response that addresses the user's request and offer
         
         # Additional credits based on message complexity
         additional_credits = 0
+        message = user_message.lower()
         
         # Check for complex requests
-        if any(word in user_message.lower() for word in ['budget', 'cost', 'money', 'expensive', 'cheaper']):
+        if any(word in message for word in ['budget', 'cost', 'money', 'expensive', 'cheaper']):
             additional_credits += 1
         
-        if any(word in user_message.lower() for word in ['itinerary', 'schedule', 'activities', 'plan']):
+        if any(word in message for word in ['itinerary', 'schedule', 'activities', 'plan']):
             additional_credits += 1
         
-        if any(word in user_message.lower() for word in ['accommodation', 'hotel', 'stay', 'lodging']):
+        if any(word in message for word in ['accommodation', 'hotel', 'stay', 'lodging']):
             additional_credits += 1
         
-        if any(word in user_message.lower() for word in ['restaurant', 'food', 'dining', 'cuisine']):
+        if any(word in message for word in ['restaurant', 'food', 'dining', 'cuisine']):
             additional_credits += 1
         
         # Credits based on response length
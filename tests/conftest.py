@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+
+# The app modules import each other by bare name from src/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# vertex_ai_utils opens a log file at import; keep it out of the working tree
+os.environ.setdefault("VERTEX_AI_LOG", os.path.join(tempfile.gettempdir(), "wayfarer-tests-vertex.log"))
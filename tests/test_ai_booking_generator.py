@@ -0,0 +1,213 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("vertexai")
+
+import ai_booking_generator as abg
+from google.api_core.exceptions import InvalidArgument
+
+
+FLIGHT = {
+    "flight_id": "AI101", "airline": "Air India", "flight_number": "AI101",
+    "origin": "DEL", "destination": "BOM", "departure_time": "06:30", "arrival_time": "08:45",
+    "duration": "2h 15m", "price": 4500, "currency": "INR", "class_type": "Economy",
+    "available_seats": 12, "stops": "Non-stop", "aircraft": "Airbus A320"
+}
+HOTEL = {
+    "hotel_id": "hotel_1", "name": "Taj Palace", "city": "Mumbai", "address": "1 Marine Drive",
+    "star_rating": 5, "price_per_night": 8000, "currency": "INR", "check_in": "2025-09-20",
+    "check_out": "2025-09-25", "total_price": 40000, "amenities": ["WiFi", "Pool"],
+    "room_type": "Deluxe Room", "available_rooms": 3, "cancellation_policy": "Free cancellation",
+    "rating": 4.6, "reviews_count": 320
+}
+
+
+@pytest.fixture
+def generator():
+    return abg.AIBookingDataGenerator()
+
+
+# ---------------- _parse_json_items ---------------- #
+
+def test_parse_json_items_keeps_valid_array_intact(generator):
+    items = [dict(FLIGHT, flight_id=f"AI10{i}") for i in range(3)]
+    assert generator._parse_json_items(json.dumps(items, indent=2)) == (items, True)
+
+
+def test_parse_json_items_strips_code_fence(generator):
+    items = [FLIGHT, FLIGHT, FLIGHT]
+    text = "```json\n" + json.dumps(items) + "\n```"
+    assert generator._parse_json_items(text) == (items, True)
+
+
+def test_parse_json_items_pads_short_results_to_three(generator):
+    result, from_model = generator._parse_json_items(json.dumps([HOTEL]))
+    assert from_model
+    assert len(result) == 3
+    assert result[0] == HOTEL
+    assert [hotel["hotel_id"] for hotel in result[1:]] == ["hotel_1001", "hotel_1002"]
+    # Padding must not mutate the model's item
+    assert HOTEL["name"] == "Taj Palace"
+
+
+def test_parse_json_items_recovers_truncated_output(generator):
+    text = json.dumps([FLIGHT, FLIGHT])[:-40]
+    result, from_model = generator._parse_json_items(text)
+    assert result and from_model
+    assert all(isinstance(item, dict) for item in result)
+
+
+# ---------------- _validate_*_data ---------------- #
+
+def test_validate_flight_data_whitelists_and_pins_search_fields(generator):
+    flight = dict(FLIGHT, extra=1, origin="XXX", currency="USD")
+    validated, = generator._validate_flight_data([flight], "DEL", "BOM", "2025-09-20")
+    assert "extra" not in validated
+    assert list(validated) == list(abg._FLIGHT_DEFAULTS)
+    assert (validated["origin"], validated["destination"], validated["currency"]) == ("DEL", "BOM", "INR")
+    assert validated["price"] == 4500
+
+
+def test_validate_flight_data_fills_missing_fields(generator):
+    validated, = generator._validate_flight_data([{}], "DEL", "BOM", "2025-09-20")
+    assert validated["airline"] == "Unknown Airline"
+    assert validated["flight_id"].startswith("FL")
+    assert validated["flight_number"].startswith("FL")
+
+
+def test_validate_hotel_data_whitelists_and_prices_the_stay(generator):
+    hotel = dict(HOTEL, extra=1, city="Elsewhere")
+    validated, = generator._validate_hotel_data([hotel], "Mumbai", "2025-09-20", "2025-09-23")
+    assert "extra" not in validated
+    assert list(validated) == list(abg._HOTEL_DEFAULTS)
+    assert validated["city"] == "Mumbai"
+    assert validated["total_price"] == 8000 * 3
+
+
+def test_validate_hotel_data_defaults_are_per_record(generator):
+    first, second = generator._validate_hotel_data([{}, {}], "Goa", "2025-09-20", "2025-09-21")
+    assert first["name"] == "Hotel in Goa"
+    assert first["amenities"] == ["WiFi", "Pool", "Gym", "Restaurant"]
+    assert first["amenities"] is not second["amenities"]
+
+
+def test_validate_hotel_data_empty_list_ignores_dates(generator):
+    assert generator._validate_hotel_data([], "C", "", "") == []
+
+
+def test_validate_hotel_data_bad_dates_price_one_night(generator, caplog):
+    validated, = generator._validate_hotel_data([HOTEL], "Mumbai", "", "not-a-date")
+    assert validated["total_price"] == HOTEL["price_per_night"]
+    assert "Invalid stay dates" in caplog.text
+
+
+def test_ymd_to_ordinal_rejects_non_iso_dates():
+    with pytest.raises(ValueError):
+        abg._ymd_to_ordinal("2025/09/20")
+
+
+# ---------------- structured output ---------------- #
+
+@pytest.mark.parametrize("model_name, expected", [
+    ("gemini-pro", False),
+    ("gemini-1.0-pro-002", False),
+    ("gemini-1.5-flash", True),
+    ("projects/p/locations/l/publishers/google/models/gemini-2.0-flash", True),
+    (None, False),
+])
+def test_supports_controlled_generation(model_name, expected):
+    assert abg._supports_controlled_generation(model_name) is expected
+
+
+class _FakeModel:
+    def __init__(self, failures=0, error="response_schema is not supported"):
+        self.failures = failures
+        self.error = error
+        self.configs = []
+
+    def generate_content(self, prompt, generation_config=None):
+        self.configs.append(generation_config)
+        if self.failures:
+            self.failures -= 1
+            raise InvalidArgument(self.error)
+        return SimpleNamespace(text="[]")
+
+
+def test_generate_json_content_retries_without_schema(generator):
+    model = _FakeModel(failures=1)
+    generator.vertex_ai = SimpleNamespace(model=model, model_name="gemini-1.5-flash", is_configured=True)
+    generator._generate_json_content("prompt", "flight")
+    generator._generate_json_content("prompt", "flight")
+    assert model.configs == [
+        abg._json_generation_config("flight", True),
+        abg._json_generation_config("flight", False),
+        abg._json_generation_config("flight", False),
+    ]
+
+
+def test_generate_json_content_keeps_schema_after_unrelated_errors(generator):
+    model = _FakeModel(failures=1, error="Request contains an invalid argument: prompt is empty")
+    generator.vertex_ai = SimpleNamespace(model=model, model_name="gemini-1.5-flash", is_configured=True)
+    with pytest.raises(InvalidArgument):
+        generator._generate_json_content("prompt", "flight")
+    generator._generate_json_content("prompt", "flight")
+    assert model.configs == [abg._json_generation_config("flight", True)] * 2
+
+
+def test_generate_json_content_skips_schema_for_legacy_models(generator):
+    model = _FakeModel()
+    generator.vertex_ai = SimpleNamespace(model=model, model_name="gemini-pro", is_configured=True)
+    generator._generate_json_content("prompt", "hotel")
+    assert model.configs == [abg._json_generation_config("hotel", False)]
+
+
+# ---------------- suggestion cache ---------------- #
+
+def test_suggestion_cache_returns_copies(generator):
+    key = generator._suggestion_cache_key("prompt")
+    generator._store_suggestions(key, [FLIGHT])
+    cached = generator._get_cached_suggestions(key)
+    assert cached == [FLIGHT]
+    cached[0]["price"] = 1
+    assert generator._get_cached_suggestions(key) == [FLIGHT]
+
+
+def test_suggestion_cache_expires(generator, monkeypatch):
+    monkeypatch.setattr(abg, "_SUGGESTION_CACHE_TTL", 0)
+    key = generator._suggestion_cache_key("prompt")
+    generator._store_suggestions(key, [FLIGHT])
+    assert generator._get_cached_suggestions(key) is None
+    assert key not in generator._suggestion_cache
+
+
+def test_parse_json_items_flags_unparseable_output(generator):
+    assert generator._parse_json_items("Sorry, I can't help with that.") == ([], False)
+
+
+@pytest.mark.parametrize("text", ["Sorry, I can't help with that.", "[]"])
+def test_unparsed_flight_response_is_not_cached(generator, text):
+    model = SimpleNamespace(generate_content=lambda prompt, generation_config=None: SimpleNamespace(text=text))
+    generator.vertex_ai = SimpleNamespace(model=model, model_name="gemini-pro", is_configured=True)
+    assert generator._generate_ai_flight_suggestions("DEL", "BOM", "2025-09-20") == []
+    assert not generator._suggestion_cache
+
+
+def test_parsed_hotel_response_is_cached(generator):
+    model = SimpleNamespace(generate_content=lambda prompt, generation_config=None: SimpleNamespace(text=json.dumps([HOTEL] * 3)))
+    generator.vertex_ai = SimpleNamespace(model=model, model_name="gemini-pro", is_configured=True)
+    generator._generate_ai_hotel_suggestions("Mumbai", "2025-09-20", "2025-09-25")
+    assert len(generator._suggestion_cache) == 1
+
+
+def test_suggestion_cache_evicts_least_recently_used(generator, monkeypatch):
+    monkeypatch.setattr(abg, "_SUGGESTION_CACHE_SIZE", 2)
+    keys = [generator._suggestion_cache_key(str(i)) for i in range(3)]
+    generator._store_suggestions(keys[0], [FLIGHT])
+    generator._store_suggestions(keys[1], [FLIGHT])
+    generator._get_cached_suggestions(keys[0])
+    generator._store_suggestions(keys[2], [FLIGHT])
+    assert generator._get_cached_suggestions(keys[1]) is None
+    assert generator._get_cached_suggestions(keys[0]) == [FLIGHT]
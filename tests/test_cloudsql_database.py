@@ -0,0 +1,139 @@
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("bcrypt")
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("google.cloud.sql.connector")
+
+# Importing the module builds the global manager; keep it away from a real Cloud SQL instance
+with mock.patch("google.cloud.sql.connector.Connector"), mock.patch("sqlalchemy.create_engine"):
+    import cloudsql_database as cdb
+
+
+@pytest.fixture
+def manager():
+    with mock.patch.object(cdb, "Connector"), mock.patch("sqlalchemy.create_engine"):
+        manager = cdb.MySQLDatabaseManager()
+    manager.engine = mock.MagicMock()
+    return manager
+
+
+def _write_conn(manager):
+    return manager.engine.begin.return_value.__enter__.return_value
+
+
+def _read_conn(manager):
+    return manager.engine.connect.return_value.__enter__.return_value
+
+
+# ---------------- SQL ---------------- #
+
+def test_user_credits_sql_binds_only_user_id():
+    assert set(cdb._USER_CREDITS_SQL.compile().params) == {"uid"}
+
+
+def test_google_upsert_sql_returns_existing_id_on_duplicate():
+    sql = cdb._UPSERT_GOOGLE_USER_SQL.text
+    assert "ON DUPLICATE KEY UPDATE" in sql
+    assert "id = LAST_INSERT_ID(id)" in sql
+
+
+def test_welcome_bonus_sql_is_guarded():
+    assert "WHERE NOT EXISTS" in cdb._INSERT_WELCOME_BONUS_ONCE_SQL.text
+
+
+# ---------------- Indexes ---------------- #
+
+def _index_conn(create_error):
+    conn = mock.MagicMock()
+    existing = mock.MagicMock()
+    existing.scalars.return_value = []
+
+    def execute(statement, *args):
+        if statement.text.startswith("CREATE INDEX") and create_error:
+            raise cdb.OperationalError(statement.text, {}, create_error)
+        return existing
+
+    conn.execute.side_effect = execute
+    return conn
+
+
+def test_ensure_indexes_tolerates_a_concurrent_create(manager):
+    conn = _index_conn(Exception(cdb._ER_DUP_KEYNAME, "Duplicate key name"))
+    manager._ensure_indexes(conn)
+    assert conn.execute.call_count == 1 + len(cdb._INDEXES)
+
+
+def test_ensure_indexes_raises_other_errors(manager):
+    conn = _index_conn(Exception(1142, "CREATE command denied"))
+    with pytest.raises(cdb.OperationalError):
+        manager._ensure_indexes(conn)
+
+
+# ---------------- Google upsert ---------------- #
+
+def test_create_google_user_grants_bonus_on_insert(manager):
+    conn = _write_conn(manager)
+    conn.execute.return_value.rowcount = 1
+    conn.execute.return_value.lastrowid = 42
+
+    assert manager.create_google_user("ann", "ann@example.com", "Ann", "g-1")[0] is True
+
+    (upsert, upsert_params), (bonus, bonus_params) = [c.args for c in conn.execute.call_args_list]
+    assert upsert is cdb._UPSERT_GOOGLE_USER_SQL
+    assert upsert_params["verified_email"] is False
+    assert bonus is cdb._INSERT_WELCOME_BONUS_ONCE_SQL
+    assert bonus_params == {
+        "user_id": 42,
+        "transaction_type": cdb.WELCOME_BONUS[0],
+        "credits_amount": cdb.WELCOME_BONUS[1],
+        "description": cdb.WELCOME_BONUS[2],
+    }
+
+
+def test_create_google_user_skips_bonus_for_existing_user(manager):
+    conn = _write_conn(manager)
+    conn.execute.return_value.rowcount = 2
+
+    assert manager.create_google_user("ann", "ann@example.com", "Ann", "g-1")[0] is True
+    assert conn.execute.call_count == 1
+
+
+# ---------------- Credits ---------------- #
+
+def test_get_user_credits_summarises_one_row(manager):
+    _read_conn(manager).execute.return_value.fetchone.return_value = (1000, 300, 700, 3)
+
+    assert manager.get_user_credits(7) == {
+        'total_credits': 1000,
+        'credits_used': 300,
+        'credits_remaining': 700,
+        'total_trips': 3,
+        'avg_credits_per_trip': 100,
+    }
+
+
+def test_get_user_credits_is_cached_until_a_write(manager):
+    conn = _read_conn(manager)
+    conn.execute.return_value.fetchone.return_value = (1000, 0, 1000, 0)
+
+    first = manager.get_user_credits(7)
+    first['credits_remaining'] = 0
+    assert manager.get_user_credits(7)['credits_remaining'] == 1000
+    assert conn.execute.call_count == 1
+
+    manager.add_credit_transaction(7, None, "purchase", 500, "Top-up")
+    manager.get_user_credits(7)
+    assert conn.execute.call_count == 2
+
+
+def test_get_user_credits_expires(manager):
+    conn = _read_conn(manager)
+    conn.execute.return_value.fetchone.return_value = (1000, 0, 1000, 0)
+    manager.credits_cache_ttl = 0
+
+    manager.get_user_credits(7)
+    manager.get_user_credits(7)
+    assert conn.execute.call_count == 2